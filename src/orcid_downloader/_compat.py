@@ -0,0 +1,15 @@
+"""Optional accelerated implementations, with fallbacks to the standard library."""
+
+import gzip
+import types
+
+__all__ = [
+    "gzip_impl",
+]
+
+gzip_impl: types.ModuleType
+try:
+    # ISA-L's igzip is a drop-in replacement for gzip with SIMD-accelerated (de)compression
+    from isal import igzip as gzip_impl
+except ImportError:
+    gzip_impl = gzip
@@ -3,19 +3,26 @@
 from __future__ import annotations
 
 import csv
-import gzip
-import json
+import gc
+import io
 import logging
+import multiprocessing
+import os
+import re
 import tarfile
 import typing
-from collections import Counter
-from collections.abc import Iterable
-from functools import partial
+from collections import Counter, defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import batched, chain
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NamedTuple
 from urllib.parse import parse_qs, unquote, urlparse
 
 import bioregistry
+import orjson
 import pystow
 from lxml import etree
 from pydantic import BaseModel, Field
@@ -23,9 +30,16 @@ from pydantic_extra_types.country import CountryAlpha2, _index_by_alpha2
 from semantic_pydantic import SemanticField
 from tqdm.auto import tqdm
 
+from orcid_downloader._compat import gzip_impl
 from orcid_downloader.name_utils import clean_name
 from orcid_downloader.standardize import standardize_role
 
+try:
+    # rapidgzip decompresses a single gzip stream with many threads
+    import rapidgzip
+except ImportError:  # pragma: no cover
+    rapidgzip = None
+
 if TYPE_CHECKING:
     import gilda
 
@@ -35,6 +49,7 @@ __all__ = [
     "get_records",
     "ground_researcher",
     "ground_researcher_unambiguous",
+    "iter_record_dicts",
     "iter_records",
 ]
 
@@ -73,7 +88,108 @@ NAMESPACES = {
     "membership": "http://www.orcid.org/ns/membership",
     "address": "http://www.orcid.org/ns/address",
     "preferences": "http://www.orcid.org/ns/preferences",
+    "person": "http://www.orcid.org/ns/person",
+}
+
+
+def _clark(prefix: str, local_name: str) -> str:
+    """Get the Clark notation for a tag, e.g., ``{http://www.orcid.org/ns/common}path``."""
+    return f"{{{NAMESPACES[prefix]}}}{local_name}"
+
+
+ORCID_IDENTIFIER_TAG = _clark("common", "orcid-identifier")
+PATH_TAG = _clark("common", "path")
+PERSON_TAG = _clark("person", "person")
+GIVEN_NAMES_TAG = _clark("personal-details", "given-names")
+FAMILY_NAME_TAG = _clark("personal-details", "family-name")
+CREDIT_NAME_TAG = _clark("personal-details", "credit-name")
+OTHER_NAME_TAG = _clark("other-name", "content")
+EXTERNAL_IDENTIFIER_TAG = _clark("external-identifier", "external-identifier")
+RESEARCHER_URL_TAG = _clark("researcher-url", "researcher-url")
+EMAILS_TAG = _clark("email", "emails")
+EMAIL_TAG = _clark("email", "email")
+KEYWORD_TAG = _clark("keyword", "content")
+COUNTRY_TAG = _clark("address", "country")
+LOCALE_TAG = _clark("preferences", "locale")
+EMPLOYMENT_TAG = _clark("employment", "employment-summary")
+EDUCATION_TAG = _clark("education", "education-summary")
+MEMBERSHIP_TAG = _clark("membership", "membership-summary")
+WORKS_TAG = _clark("activities", "works")
+GROUP_TAG = _clark("activities", "group")
+
+#: The tags for which :func:`_process_file` receives events while
+#: streaming through a record. Everything else is skipped by lxml.
+ITERPARSE_TAGS = (
+    ORCID_IDENTIFIER_TAG,
+    PERSON_TAG,
+    GIVEN_NAMES_TAG,
+    FAMILY_NAME_TAG,
+    CREDIT_NAME_TAG,
+    OTHER_NAME_TAG,
+    EXTERNAL_IDENTIFIER_TAG,
+    RESEARCHER_URL_TAG,
+    EMAILS_TAG,
+    KEYWORD_TAG,
+    COUNTRY_TAG,
+    LOCALE_TAG,
+    EMPLOYMENT_TAG,
+    EDUCATION_TAG,
+    MEMBERSHIP_TAG,
+    GROUP_TAG,
+)
+#: Parser options for :func:`lxml.etree.iterparse`. Dropping the whitespace between
+#: elements means libxml2 allocates far fewer text nodes, and the records don't
+#: use IDs or entities, so there's no need to index or resolve them
+ITERPARSE_KWARGS = {
+    "remove_blank_text": True,
+    "collect_ids": False,
+    "resolve_entities": False,
 }
+
+
+#: Tags of the children of the elements in :data:`ITERPARSE_TAGS`. These are
+#: looked up with :func:`_find_child`, since the structure of the records is known
+EXTERNAL_IDS_TAG = _clark("common", "external-ids")
+EXTERNAL_ID_TAG = _clark("common", "external-id")
+EXTERNAL_ID_TYPE_TAG = _clark("common", "external-id-type")
+EXTERNAL_ID_VALUE_TAG = _clark("common", "external-id-value")
+EXTERNAL_ID_URL_TAG = _clark("common", "external-id-url")
+URL_TAG = _clark("researcher-url", "url")
+URL_NAME_TAG = _clark("researcher-url", "url-name")
+ORGANIZATION_TAG = _clark("common", "organization")
+ORGANIZATION_NAME_TAG = _clark("common", "name")
+DISAMBIGUATED_ORGANIZATION_TAG = _clark("common", "disambiguated-organization")
+DISAMBIGUATION_SOURCE_TAG = _clark("common", "disambiguation-source")
+DISAMBIGUATED_ORGANIZATION_ID_TAG = _clark("common", "disambiguated-organization-identifier")
+START_DATE_TAG = _clark("common", "start-date")
+END_DATE_TAG = _clark("common", "end-date")
+YEAR_TAG = _clark("common", "year")
+MONTH_TAG = _clark("common", "month")
+DAY_TAG = _clark("common", "day")
+#: The keys in a :class:`Date` for each of the parts of a date element
+DATE_PART_KEYS = {YEAR_TAG: "year", MONTH_TAG: "month", DAY_TAG: "day"}
+ROLE_TITLE_TAG = _clark("common", "role-title")
+
+
+def _find_child(element, tag: str):
+    """Get the first child with the given tag, like :meth:`find` does.
+
+    Filtering :meth:`iterchildren` on a fully qualified tag is a plain C-level
+    comparison, which is faster than both ``find`` and compiled XPaths.
+    """
+    if element is None:
+        return None
+    return next(element.iterchildren(tag), None)
+
+
+def _find_child_text(element, tag: str) -> str | None:
+    """Get the text of the first child with the given tag, like :meth:`findtext` does."""
+    child = _find_child(element, tag)
+    if child is None:
+        return None
+    return child.text or ""
+
+
 MODULE_RAW = pystow.module("orcid", VERSION_2023.version)
 MODULE = MODULE_RAW.module("output")
 RECORDS_PATH = MODULE.join(name="records.jsonl.gz")
@@ -100,7 +216,8 @@ EMPLOYMENT_ROLE_SUMMARY_PATH = ROLES.join(name="employment_role_summary.tsv.gz")
 AFFILIATION_NO_ROR_PATH = ROLES.join(name="affiliation_missing_ror.tsv")
 
 
-def _norm_key(id_type):
+@lru_cache(maxsize=8192)
+def _norm_key(id_type: str) -> str:
     return id_type.lower().replace(" ", "").rstrip(":")
 
 
@@ -159,52 +276,64 @@ EXTERNAL_ID_MAPPING = {
     "ssrnpage": "ssrn.author",
 }
 
-for key, value in EXTERNAL_ID_MAPPING.items():
-    _resource = bioregistry.get_resource(value)
-    if _resource is None:
-        raise ValueError(f"Unregistered prefix in EXTERNAL_ID_MAPPING for {key} - {value}")
-    if _resource.prefix != value:
-        raise ValueError(
-            f"Mapping uses non-standard prefix for {key} - {value} should be {_resource.prefix}"
-        )
+EXTERNAL_ID_MAPPING = {_norm_key(k): v for k, v in EXTERNAL_ID_MAPPING.items()}
+
+
+def _validate_mapping() -> None:
+    """Check that :data:`EXTERNAL_ID_MAPPING` only uses standard Bioregistry prefixes.
+
+    This isn't run on import, since it's only needed when the mapping changes.
+    It's covered by the tests instead.
+
+    :raises ValueError: if a prefix isn't registered or isn't standardized
+    """
+    for key, value in EXTERNAL_ID_MAPPING.items():
+        resource = bioregistry.get_resource(value)
+        if resource is None:
+            raise ValueError(f"Unregistered prefix in EXTERNAL_ID_MAPPING for {key} - {value}")
+        if resource.prefix != value:
+            raise ValueError(
+                f"Mapping uses non-standard prefix for {key} - {value} should be {resource.prefix}"
+            )
 
 
-EXTERNAL_ID_MAPPING = {_norm_key(k): v for k, v in EXTERNAL_ID_MAPPING.items()}
 UNMAPPED_EXTERNAL_ID: set[str] = set()
-PERSONAL_KEYS = {
-    "website",
-    "homepage",
-    "blog",
-    "personalpage",
-    "personalhomepage",
-    "personalwebsite",
-    "personalwebsites",
-    "personalweb-page",
-    "personalwebpage",
-    "webpage",
-    "personal",
-    "professionalwebsite",
-    "personalsite",
-    "personalblog",
-    "mywebsite",
-    "mysite",
-    "officialweb-page",
-    "sitiowebpersonal",
-    "paginaweb",
-    "personelwebsite",
-    "blogpessoal",
-    "mypersonalsite",
-    "mypersonalblog",
-    "personalweb-site",
-    "web-site",
-    "professionalblog",
-    "personalwebsiteandblog",
-    "myweb",
-    "homewebsite",
-    "personalweb",
-    "mypersonalwebsite",
-    "blogpersonal",
-}
+PERSONAL_KEYS = frozenset(
+    {
+        "website",
+        "homepage",
+        "blog",
+        "personalpage",
+        "personalhomepage",
+        "personalwebsite",
+        "personalwebsites",
+        "personalweb-page",
+        "personalwebpage",
+        "webpage",
+        "personal",
+        "professionalwebsite",
+        "personalsite",
+        "personalblog",
+        "mywebsite",
+        "mysite",
+        "officialweb-page",
+        "sitiowebpersonal",
+        "paginaweb",
+        "personelwebsite",
+        "blogpessoal",
+        "mypersonalsite",
+        "mypersonalblog",
+        "personalweb-site",
+        "web-site",
+        "professionalblog",
+        "personalwebsiteandblog",
+        "myweb",
+        "homewebsite",
+        "personalweb",
+        "mypersonalwebsite",
+        "blogpersonal",
+    }
+)
 
 
 def ensure_summaries() -> Path:
@@ -274,11 +403,13 @@ class Record(BaseModel):
         """Return if the record is high quality."""
         # just see if there's literally anything in there
         return bool(
-            any("ror" in employment.xrefs for employment in self.employments)
-            or any("ror" in education.xrefs for education in self.educations)
-            # or any("ror" in membership.xrefs for membership in self.memberships)
-            or self.works
+            self.works
             or self.xrefs
+            or any(
+                "ror" in affiliation.xrefs
+                # could also include self.memberships
+                for affiliation in chain(self.employments, self.educations)
+            )
         )
 
     @property
@@ -352,68 +483,265 @@ class Record(BaseModel):
         return None
 
 
-def _iter_tarfile_members(path: Path):
-    tar_file = tarfile.open(path)
-    while member := tar_file.next():
-        if not member.name.endswith(".xml"):
+def _iter_tarfile_bytes(path: Path) -> Iterable[bytes]:
+    """Iterate over the contents of the XML files in the tar archive.
+
+    The bytes are read in the main process, so they can be sent to worker
+    processes, which can't share the tar file handle.
+    """
+    with _open_gzip_stream(path) as file, tarfile.open(fileobj=file, mode="r|") as tar_file:
+        for member in tar_file:
+            if not member.isfile() or not member.name.endswith(".xml"):
+                continue
+            # when streaming, a member's data directly follows its header, so it can be
+            # read from the stream in one call without wrapping it in a file object
+            yield tar_file.fileobj.read(member.size)
+
+
+#: The buffer size for reading decompressed gzip streams
+TAR_BUFFER_SIZE = 1 << 20
+
+
+def _open_gzip_stream(path: Path) -> typing.BinaryIO:
+    """Open a gzipped file as a decompressed binary stream, in parallel if possible.
+
+    The stream is buffered, so it can also be efficiently iterated line by line.
+    """
+    if rapidgzip is not None:
+        # rapidgzip's file is a raw stream, whose readline would go byte by byte
+        raw = rapidgzip.open(str(path), parallelization=os.cpu_count() or 1)
+    else:
+        raw = gzip_impl.open(path, "rb")
+    return io.BufferedReader(raw, buffer_size=TAR_BUFFER_SIZE)
+
+
+#: The number of XML files sent to a worker process at a time
+PROCESS_BATCH_SIZE = 256
+
+#: A function with the grounder and mappings bound, set in each worker process by
+#: :func:`_initialize_worker` so they don't have to be pickled for every batch
+_worker_process_file: Callable[[Any], dict[str, Any] | None] | None = None
+
+
+class _BatchResult(NamedTuple):
+    """The JSON lines processed by a worker and unknown names/sources encountered along the way.
+
+    Only the compressed lines are sent, since that's what the main process writes.
+    It decompresses them again only if the lines are iterated over.
+    """
+
+    #: the JSON lines for all records, compressed as a standalone gzip member
+    records_gz: bytes
+    #: the JSON lines for the high quality records, compressed as a standalone gzip member
+    records_hq_gz: bytes
+    unknown_names: dict[str, int]
+    unknown_names_full: dict[str, str]
+    unknown_names_examples: dict[str, str]
+    unknown_sources: dict[str, str]
+
+
+def _initialize_worker(
+    orcid_to_wikidata: dict[str, str], orcid_to_wikimedia_commons: dict[str, str]
+) -> None:
+    from orcid_downloader.ror import get_ror_grounder
+
+    global _worker_process_file
+    _worker_process_file = partial(
+        _process_file,
+        ror_grounder=get_ror_grounder(),
+        orcid_to_wikidata=orcid_to_wikidata,
+        orcid_to_wikimedia_commons=orcid_to_wikimedia_commons,
+    )
+
+
+def _process_batch(batch: Iterable[bytes]) -> _BatchResult:
+    if _worker_process_file is None:
+        raise RuntimeError("worker was not initialized")
+    # accumulate the whole batch in two buffers, so each can be
+    # compressed and written in one piece
+    records, records_hq = bytearray(), bytearray()
+    for data in batch:
+        record = _worker_process_file(io.BytesIO(data))
+        if record is None:
             continue
-        yield tar_file.extractfile(member)
-    tar_file.close()
+        line = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        records += line
+        if _is_high_quality(record):
+            records_hq += line
+    # send the unknown names and sources back to the main process, since
+    # the module-level state in the worker process isn't shared with it
+    rv = _BatchResult(
+        _compress(records),
+        _compress(records_hq),
+        UNKNOWN_NAMES.copy(),
+        UNKNOWN_NAMES_FULL.copy(),
+        UNKNOWN_NAMES_EXAMPLES.copy(),
+        UNKNOWN_SOURCES.copy(),
+    )
+    UNKNOWN_NAMES.clear()
+    UNKNOWN_NAMES_FULL.clear()
+    UNKNOWN_NAMES_EXAMPLES.clear()
+    UNKNOWN_SOURCES.clear()
+    return rv
+
+
+def _compress(data: bytes | bytearray) -> bytes:
+    """Compress data as a gzip member, which can be concatenated with others into one file.
+
+    This is done in the workers so the main process doesn't have to compress
+    every record (and the high quality ones a second time) on its own. The records
+    are written once and read many times, so favor compression speed over size.
+    """
+    if not data:
+        return b""
+    return gzip_impl.compress(data, compresslevel=1)
+
+
+def _get_max_workers() -> int:
+    """Get the number of CPUs this process is allowed to run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _get_executor(
+    orcid_to_wikidata: dict[str, str], orcid_to_wikimedia_commons: dict[str, str]
+) -> tuple[ProcessPoolExecutor, int]:
+    """Get a process pool whose workers are ready to call :func:`_process_batch`.
+
+    Where possible, the workers are forked after the grounder and the Wikidata
+    mappings are loaded in the main process, so they share its memory
+    copy-on-write instead of each loading or unpickling their own copy.
+    """
+    global _worker_process_file
+    max_workers = _get_max_workers()
+    if "fork" not in multiprocessing.get_all_start_methods():  # pragma: no cover
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_initialize_worker,
+            initargs=(orcid_to_wikidata, orcid_to_wikimedia_commons),
+        )
+        return executor, max_workers
+
+    from orcid_downloader.ror import get_ror_grounder
+
+    ror_grounder_was_loaded = get_ror_grounder.cache_info().currsize > 0
+    _initialize_worker(orcid_to_wikidata, orcid_to_wikimedia_commons)
+    # move everything loaded so far out of the garbage collector's reach, so
+    # its bookkeeping doesn't write to (and therefore copy) the shared pages
+    gc.freeze()
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+    )
+    # with fork, all workers are started on the first submission. Do this now,
+    # before any other threads (e.g., for progress or decompression) exist, since
+    # forking a multithreaded process isn't safe
+    executor.submit(os.getpid).result()
+    # the workers keep their own frozen copy, but the main process doesn't need one
+    gc.unfreeze()
+    # nor does it need the grounder and mappings, so don't keep them alive while parsing
+    _worker_process_file = None
+    if not ror_grounder_was_loaded:
+        get_ror_grounder.cache_clear()
+    return executor, max_workers
+
+
+def _imap_bounded[X, Y](
+    executor: Executor, func: Callable[[X], Y], iterable: Iterable[X], max_pending: int
+) -> Iterator[Y]:
+    """Map a function with an executor, keeping the output in order.
+
+    Unlike :meth:`concurrent.futures.Executor.map`, which consumes the whole input iterable
+    up front, this only keeps ``max_pending`` tasks in flight at a time.
+    """
+    pending: deque[Future[Y]] = deque()
+    for item in iterable:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 def iter_records(
     *, force: bool = False, records_path: Path | None = None, desc: str = "Loading ORCID"
 ) -> Iterable[Record]:
     """Parse ORCID summary XML files, takes about an hour."""
+    for line in _iter_record_lines(force=force, records_path=records_path, desc=desc):
+        yield Record.model_validate_json(line)
+
+
+def iter_record_dicts(
+    *, force: bool = False, records_path: Path | None = None, desc: str = "Loading ORCID"
+) -> Iterable[dict[str, Any]]:
+    """Iterate over records as dictionaries, without validating them as :class:`Record`.
+
+    This is several times faster than :func:`iter_records` for scanning the
+    whole corpus. Like in the records file, fields that are empty are left out.
+    """
+    for line in _iter_record_lines(force=force, records_path=records_path, desc=desc):
+        yield orjson.loads(line)
+
+
+def _iter_record_lines(
+    *, force: bool = False, records_path: Path | None = None, desc: str = "Loading ORCID"
+) -> Iterable[bytes]:
+    """Iterate over the JSON lines for each record, parsing the XML files if necessary."""
     if records_path is None:
         records_path = RECORDS_PATH
     if not force and records_path.is_file():
         tqdm.write(f"reading cached records from {records_path}")
-        with gzip.open(records_path, "rt") as file:
-            for line in tqdm(
-                file, unit_scale=True, unit="line", desc=desc, total=VERSION_2023.size
-            ):
-                yield Record.model_validate_json(line)
+        with _open_gzip_stream(records_path) as file:
+            yield from tqdm(file, unit_scale=True, unit="line", desc=desc, total=VERSION_2023.size)
 
     else:
-        from orcid_downloader.ror import get_ror_grounder
-        from orcid_downloader.wikidata import get_orcid_to_commons_image, get_orcid_to_wikidata
-
-        ror_grounder = get_ror_grounder()
-        orcid_to_wikidata = get_orcid_to_wikidata()
-        orcid_to_wikimedia_commons = get_orcid_to_commons_image()
-        f = partial(
-            _process_file,
-            ror_grounder=ror_grounder,
-            orcid_to_wikidata=orcid_to_wikidata,
-            orcid_to_wikimedia_commons=orcid_to_wikimedia_commons,
-        )
+        for records_gz in _parse_records(records_path):
+            # orjson escapes newlines in strings, so this splits exactly on records
+            yield from gzip_impl.decompress(records_gz).splitlines()
 
-        path = ensure_summaries()
-        it = _iter_tarfile_members(path)
-        # TODO use process_map with chunksize=50_000
 
-        with (
-            gzip.open(records_path, "wt") as records_file,
-            gzip.open(RECORDS_HQ_PATH, "wt") as records_hq_file,
-        ):
-            for file in tqdm(it, unit_scale=True, unit="record", total=VERSION_2023.size):
-                record: Record | None = f(file)
-                if record is None:
-                    continue
-                line = record.model_dump_json(exclude_defaults=True, indent=None) + "\n"
-                records_file.write(line)
-                if record.is_high_quality():
-                    records_hq_file.write(line)
-                yield record
-
-        with URL_NAMES_PATH.open("w") as file:
-            writer = csv.writer(file, delimiter="\t")
-            writer.writerow(("norm_name", "name", "count", "example"))
-            writer.writerows(
-                (norm_name, UNKNOWN_NAMES_FULL[norm_name], count, UNKNOWN_NAMES_EXAMPLES[norm_name])
-                for norm_name, count in UNKNOWN_NAMES.most_common()
-            )
+def _parse_records(records_path: Path) -> Iterable[bytes]:
+    """Parse the XML files and write the records, yielding each batch's compressed lines."""
+    from orcid_downloader.wikidata import get_orcid_to_commons_image, get_orcid_to_wikidata
+
+    path = ensure_summaries()
+    executor, max_workers = _get_executor(get_orcid_to_wikidata(), get_orcid_to_commons_image())
+    it = tqdm(_iter_tarfile_bytes(path), unit_scale=True, unit="record", total=VERSION_2023.size)
+    with (
+        executor,
+        # the workers send already compressed gzip members, which are
+        # concatenated into a valid multi-member gzip file
+        records_path.open("wb") as records_file,
+        RECORDS_HQ_PATH.open("wb") as records_hq_file,
+    ):
+        # the workers count with plain dicts, so sum the counts up here
+        unknown_names: typing.Counter[str] = Counter()
+        results = _imap_bounded(
+            executor,
+            _process_batch,
+            batched(it, PROCESS_BATCH_SIZE),
+            # keep a few batches queued per worker so none go idle
+            max_pending=4 * max_workers,
+        )
+        for result in results:
+            unknown_names.update(result.unknown_names)
+            UNKNOWN_NAMES_FULL.update(result.unknown_names_full)
+            UNKNOWN_NAMES_EXAMPLES.update(result.unknown_names_examples)
+            UNKNOWN_SOURCES.update(result.unknown_sources)
+            records_file.write(result.records_gz)
+            records_hq_file.write(result.records_hq_gz)
+            if result.records_gz:
+                yield result.records_gz
+
+    with URL_NAMES_PATH.open("w") as file:
+        writer = csv.writer(file, delimiter="\t")
+        writer.writerow(("norm_name", "name", "count", "example"))
+        writer.writerows(
+            (norm_name, UNKNOWN_NAMES_FULL[norm_name], count, UNKNOWN_NAMES_EXAMPLES[norm_name])
+            for norm_name, count in unknown_names.most_common()
+        )
+    if UNKNOWN_SOURCES:
+        logger.warning("unhandled disambiguation sources: %s", UNKNOWN_SOURCES)
 
 
 def get_records(*, force: bool = False) -> dict[str, Record]:
@@ -426,140 +754,338 @@ def _process_file(  # noqa:C901
     ror_grounder: gilda.Grounder,
     orcid_to_wikidata: dict[str, str],
     orcid_to_wikimedia_commons: dict[str, str],
-) -> Record | None:
+) -> dict[str, Any] | None:
     """Process a file obnect for an XML file.
 
     :param file: An XML file object
     :param ror_grounder: A grounder object for ROR
     :param orcid_to_wikidata: A one-to-one mapping from ORCID to Wikidata identifiers
     :param orcid_to_wikimedia_commons: A mapping from ORCID to Wikimedia Commons image tags
-    :return: A record
+    :return: A dictionary that can be validated by :class:`Record`, without any of
+        the default values, so it can be directly serialized to JSON
+
+    The file is streamed in a single pass with :func:`lxml.etree.iterparse`, only
+    stopping on the tags in :data:`ITERPARSE_TAGS`. Each element is cleared as soon
+    as its values are extracted, so the full document is never kept in memory.
 
     .. code-block:: python
 
         grounder = get_ror_grounder()
-        with open("../../example.xml") as file:
-            print(
-                _process_file(file, grounder).model_dump_json(
-                    indent=2,
-                    exclude_none=True,
-                    exclude_unset=True,
-                    exclude_defaults=True,
-                )
-            )
+        with open("../../example.xml", "rb") as file:
+            print(orjson.dumps(_process_file(file, grounder), option=orjson.OPT_INDENT_2))
     """
-    tree = etree.parse(file)  # noqa:S320
-
-    orcid = tree.findtext(".//common:path", namespaces=NAMESPACES)
-    if not orcid:
-        return None
-
-    family_name = tree.findtext(".//personal-details:family-name", namespaces=NAMESPACES)
-    given_names = tree.findtext(".//personal-details:given-names", namespaces=NAMESPACES)
-    if family_name and given_names:
-        label_name = f"{given_names.strip()} {family_name.strip()}"
-    else:
-        label_name = None
-
-    credit_name = tree.findtext(".//personal-details:credit-name", namespaces=NAMESPACES)
-    if credit_name:
-        credit_name = credit_name.strip()
-
-    if not credit_name and not label_name:
-        # Skip records that don't have any kinds of labels
+    orcid: str | None = None
+    given_names: str | None = None
+    family_name: str | None = None
+    credit_name: str | None = None
+    locale: str | None = None
+    name: str | None = None
+    has_label = False
+    aliases: dict[str, None] = {}
+    other_names: list[str] = []
+    external_identifiers: list[tuple[str | None, str | None, str | None]] = []
+    researcher_urls: list[tuple[str | None, str]] = []
+    emails: list[str] = []
+    keywords: list[str] = []
+    countries: list[str] = []
+    work_identifiers: list[tuple[str | None, str | None]] = []
+    employments: list[dict[str, Any]] = []
+    educations: list[dict[str, Any]] = []
+    memberships: list[dict[str, Any]] = []
+
+    for _, element in etree.iterparse(  # noqa:S320
+        file, events=("end",), tag=ITERPARSE_TAGS, **ITERPARSE_KWARGS
+    ):
+        tag = element.tag
+        if tag == ORCID_IDENTIFIER_TAG:
+            orcid = _find_child_text(element, PATH_TAG)
+        elif tag == GIVEN_NAMES_TAG:
+            # unlike with _strip, a blank name is kept as an empty string, since
+            # the label can still be made when the other part isn't blank
+            given_names = element.text and element.text.strip()
+        elif tag == FAMILY_NAME_TAG:
+            family_name = element.text and element.text.strip()
+        elif tag == CREDIT_NAME_TAG:
+            credit_name = _strip(element.text)
+        elif tag == OTHER_NAME_TAG:
+            if element.text:
+                other_names.append(element.text)
+        elif tag == EXTERNAL_IDENTIFIER_TAG:
+            external_identifiers.append(_get_external_identifier(element))
+        elif tag == RESEARCHER_URL_TAG:
+            if (researcher_url := _get_researcher_url(element)) is not None:
+                researcher_urls.append(researcher_url)
+        elif tag == EMAILS_TAG:
+            for email_element in element.iterchildren(EMAIL_TAG):
+                if email := _find_child_text(email_element, EMAIL_TAG):
+                    emails.append(email.strip())
+        elif tag == KEYWORD_TAG:
+            if element.text:
+                keywords.append(element.text.strip())
+        elif tag == COUNTRY_TAG:
+            if element.text:
+                countries.append(element.text)
+        elif tag == LOCALE_TAG:
+            if element.text is not None:
+                locale = element.text.strip()
+        elif tag == PERSON_TAG:
+            # The person section always comes before the activities section, so
+            # records without an ORCID or labels can be skipped before any of the
+            # (comparatively expensive) affiliation grounding or work parsing
+            if not orcid:
+                return None
+            name, aliases = _get_name_and_aliases(
+                given_names, family_name, credit_name, other_names
+            )
+            if name is None:
+                # Skip records that don't have any kinds of labels
+                return None
+            has_label = True
+        elif tag == EMPLOYMENT_TAG:
+            if (employment := _get_affiliation(element, ror_grounder)) is not None:
+                employments.append(employment)
+        elif tag == EDUCATION_TAG:
+            if (education := _get_affiliation(element, ror_grounder)) is not None:
+                educations.append(education)
+        elif tag == MEMBERSHIP_TAG:
+            if (membership := _get_affiliation(element, ror_grounder)) is not None:
+                memberships.append(membership)
+        elif tag == GROUP_TAG and element.getparent().tag == WORKS_TAG:
+            # activities:group is also used for fundings, peer reviews, etc.
+            work_identifiers.append(_get_work_identifier(element))
+
+        # free the memory from the element and all of its previous siblings,
+        # since they've already been fully processed
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+    if not orcid or not has_label:
         return None
 
-    aliases: set[str] = set()
-    if not credit_name:
-        name = label_name
-    else:
-        name = credit_name
-        if label_name is not None:
-            aliases.add(label_name)
-
-    name = name and clean_name(name)
-    aliases.update(_iter_other_names(tree))
-    if name in aliases:  # make sure there's no duplicate
-        aliases.remove(name)
-    name, aliases = _reconcile_aliass(name, aliases)
-
     record: dict[str, Any] = {"orcid": orcid, "name": name}
     if aliases:
         record["aliases"] = sorted(aliases)
 
-    employments = _get_employments(tree, grounder=ror_grounder)
     if employments:
         record["employments"] = employments
 
-    educations = _get_educations(tree, grounder=ror_grounder)
     if educations:
         record["educations"] = educations
 
-    memberships = _get_memberships(tree, grounder=ror_grounder)
     if memberships:
         record["memberships"] = memberships
 
-    ids, homepage = _get_external_identifiers(tree, orcid=orcid)
+    ids, homepage = _get_external_identifiers(external_identifiers, researcher_urls, orcid=orcid)
     if wikidata_id := orcid_to_wikidata.get(orcid):
         ids["wikidata"] = wikidata_id
     if ids:
-        record["xrefs"] = ids
+        # sort here, in the workers, so consumers like the SSSOM export can rely on the order
+        record["xrefs"] = dict(sorted(ids.items()))
     if homepage:
         record["homepage"] = homepage
     if image := orcid_to_wikimedia_commons.get(orcid):
         record["commons_image"] = image
 
-    if works := _get_works(tree, orcid=orcid):
+    if works := _get_works(work_identifiers, orcid=orcid):
         record["works"] = works
 
-    if emails := _get_emails(tree):
+    if emails:
         record["emails"] = emails
 
-    if keywords := _get_keywords(tree):
+    if keywords:
         record["keywords"] = sorted(keywords)
 
-    if countries := _get_countries(tree, orcid=orcid):
+    if countries := _get_countries(countries, orcid=orcid):
         record["countries"] = countries
-    if locale := _get_locale(tree, orcid=orcid):
+    if locale:
         record["locale"] = locale
 
-    return Record.parse_obj(record)
+    return record
+
+
+def _is_high_quality(record: dict[str, Any]) -> bool:
+    """Return if the record dictionary is high quality, see :meth:`Record.is_high_quality`."""
+    # check the cheap conditions first, then make a single pass over the affiliations
+    return bool(
+        record.get("works")
+        or record.get("xrefs")
+        or any(
+            "ror" in affiliation.get("xrefs", ())
+            for affiliation in chain(record.get("employments", ()), record.get("educations", ()))
+        )
+    )
+
 
+def _strip(text: str | None) -> str | None:
+    """Strip the text of an element, returning None if there's nothing left."""
+    if text is None:
+        return None
+    return text.strip() or None
+
+
+def _get_name_and_aliases(
+    given_names: str | None,
+    family_name: str | None,
+    credit_name: str | None,
+    other_names: list[str],
+) -> tuple[str | None, dict[str, None]]:
+    if family_name is not None and given_names is not None:
+        # either could be blank, e.g., if the family name is just a space, so fall
+        # back to the other one
+        label_name = f"{given_names} {family_name}".strip() or None
+    else:
+        label_name = None
+
+    if not credit_name and not label_name:
+        return None, {}
 
-def _reconcile_aliass(name: str | None, aliases: set[str]) -> tuple[str | None, set[str]]:
+    # a dictionary is used as an insertion-ordered set, which is cheaper
+    # than a set for the handful of aliases most records have
+    aliases: dict[str, None] = {}
+    if not credit_name:
+        name = label_name
+    else:
+        name = credit_name
+        if label_name is not None:
+            aliases[label_name] = None
+
+    name = clean_name(name)
+    aliases.update(dict.fromkeys(filter(None, _iter_other_names(other_names))))
+    aliases.pop(name, None)  # make sure there's no duplicate
+    return _reconcile_aliass(name, aliases)
+
+
+def _reconcile_aliass(
+    name: str | None, aliases: dict[str, None]
+) -> tuple[str | None, dict[str, None]]:
     # TODO if there is a comma in the main name picked, try and find an alias with no commas
     return name, aliases
 
 
-def _iter_other_names(t) -> Iterable[str]:
-    for part in t.findall(".//other-name:content", namespaces=NAMESPACES):
-        part = part.text.strip()
+def _iter_other_names(other_names: Iterable[str]) -> Iterable[str]:
+    for part in other_names:
+        # each piece is stripped, so there's no need to strip the whole part first
         for z in part.split(";"):
             z = z.strip()
-            if z is not None and " " in z and len(z) < 60:
-                yield clean_name(z.strip())
+            if " " in z and len(z) < 60:
+                yield clean_name(z)
 
 
-UNKNOWN_SOURCES = {}
+UNKNOWN_SOURCES: dict[str, str] = {}
 LOWERCASE_THESE_SOURCES = {"RINGGOLD", "GRID", "LEI"}
-UNKNOWN_NAMES: typing.Counter[str] = Counter()
+#: Counts of unknown researcher URL names. This is a plain dict rather than a
+#: :class:`collections.Counter`, since incrementing a dict subclass's items misses
+#: CPython's specialization for dicts and is about three times slower
+UNKNOWN_NAMES: dict[str, int] = {}
 UNKNOWN_NAMES_EXAMPLES: dict[str, str] = {}
 UNKNOWN_NAMES_FULL: dict[str, str] = {}
 
 
-def _get_external_identifiers(tree, orcid) -> tuple[dict[str, str], str | None]:  # noqa:C901
+def _get_external_identifier(element) -> tuple[str | None, str | None, str | None]:
+    """Get the type, value, and URL from an external identifier element."""
+    return (
+        _find_child_text(element, EXTERNAL_ID_TYPE_TAG),
+        _find_child_text(element, EXTERNAL_ID_VALUE_TAG),
+        _find_child_text(element, EXTERNAL_ID_URL_TAG),
+    )
+
+
+def _get_researcher_url(element) -> tuple[str | None, str] | None:
+    """Get the name and URL from a researcher URL element."""
+    url = _find_child_text(element, URL_TAG)
+    if url is None:
+        return None
+    name = _find_child_text(element, URL_NAME_TAG)
+    return name, url
+
+
+def _parse_github(identifier: str) -> tuple[str, str] | None:
+    identifier = identifier.split("?")[0]  # remove trash like ?tab=repositories
+    if "/" in identifier:  # i.e., this is a specific repo
+        return None
+    return "github", identifier
+
+
+def _parse_loop(identifier: str) -> tuple[str, str]:
+    return "loop", identifier.removesuffix("/overview").removesuffix("/bio")
+
+
+def _parse_dblp(identifier: str) -> tuple[str, str]:
+    return "dblp.author", identifier.removesuffix(".html")
+
+
+def _skip(_identifier: str) -> None:
+    return None
+
+
+#: Pairs of URL prefixes (without scheme) and functions that take the rest of the URL
+#: and return a pair of a Bioregistry prefix and local unique identifier, or None
+#: if the URL should be skipped. The first matching prefix wins.
+URL_PREFIX_RULES: tuple[tuple[str, Callable[[str], tuple[str, str] | None]], ...] = (
+    ("github.com/", _parse_github),
+    ("www.github.com/", _parse_github),
+    # skip twitter, it's not reasonable to participate on this platform anymore
+    ("twitter.com/", _skip),
+    ("x.com/", _skip),
+    ("www.wikidata.org/wiki/", lambda identifier: ("wikidata", identifier)),
+    ("tools.wmflabs.org/scholia/author/", lambda identifier: ("wikidata", identifier)),
+    ("publons.com/author/", lambda identifier: ("publons.researcher", identifier.split("/")[0])),
+    ("www.researchgate.net/profile/", lambda identifier: ("researchgate.profile", identifier)),
+    ("www.scopus.com/authid/detail.uri?authorId=", lambda identifier: ("scopus", identifier)),
+    (
+        "www.webofscience.com/wos/author/record/",
+        lambda identifier: ("wos.researcher", identifier),
+    ),
+    ("lattes.cnpq.br/", lambda identifier: ("lattes", identifier)),
+    (
+        "dialnet.unirioja.es/servlet/autor?codigo=",
+        lambda identifier: ("dialnet.author", identifier),
+    ),
+    (
+        "papers.ssrn.com/sol3/cf_dev/AbsByAuth.cfm?per_id=",
+        lambda identifier: ("ssrn.author", identifier),
+    ),
+    ("osf.io/", lambda identifier: ("osf", identifier)),
+    ("viaf.org/viaf/", lambda identifier: ("viaf", identifier)),
+    ("ieeexplore.ieee.org/author/", lambda identifier: ("ieee.author", identifier)),
+    ("loop.frontiersin.org/people/", _parse_loop),
+    ("dblp.org/pid/", _parse_dblp),
+    ("dblp.uni-trier.de/pid/", _parse_dblp),
+    ("hub.docker.com/u/", lambda identifier: ("dockerhub.user", identifier)),
+)
+#: An optional scheme followed by an optional alternation of the prefixes in
+#: :data:`URL_PREFIX_RULES`, so a URL's scheme is stripped and it's matched against all
+#: prefixes in one pass in C. Alternatives are tried in order, so the first one still wins.
+#: The scheme is matched regardless of case, since some URLs start with e.g. ``Https://``
+URL_PREFIX_RE = re.compile(
+    r"(?i:https?://)?(" + "|".join(re.escape(prefix) for prefix, _ in URL_PREFIX_RULES) + ")?"
+)
+#: The parsers from :data:`URL_PREFIX_RULES`, keyed by prefix
+URL_PREFIX_PARSERS = dict(URL_PREFIX_RULES)
+#: Prefixes whose rules win over skipping social media URLs, e.g., so a GitHub
+#: user called "facebook" is still kept
+URL_PREFIXES_BEFORE_SOCIAL_MEDIA = frozenset(
+    {"github.com/", "www.github.com/", "twitter.com/", "x.com/"}
+)
+#: Prefixes whose rules win over the LinkedIn and Google Scholar rules, which
+#: match anywhere in the URL
+URL_PREFIXES_BEFORE_PROFILES = URL_PREFIXES_BEFORE_SOCIAL_MEDIA | {
+    "www.wikidata.org/wiki/",
+    "tools.wmflabs.org/scholia/author/",
+}
+
+
+def _get_external_identifiers(  # noqa:C901
+    external_identifiers: Iterable[tuple[str | None, str | None, str | None]],
+    researcher_urls: Iterable[tuple[str | None, str]],
+    orcid: str,
+) -> tuple[dict[str, str], str | None]:
     rv = {}
     homepage = None
-    for element in tree.findall(
-        ".//external-identifier:external-identifiers/external-identifier:external-identifier",
-        namespaces=NAMESPACES,
-    ):
-        local_unique_identifier = element.findtext(
-            ".//common:external-id-value", namespaces=NAMESPACES
-        )
-        if not local_unique_identifier:
+    for id_type, local_unique_identifier, id_url in external_identifiers:
+        if not local_unique_identifier or not id_type:
             continue
-        id_type = element.findtext(".//common:external-id-type", namespaces=NAMESPACES)
         id_type_norm = _norm_key(id_type)
         if id_type_norm in EXTERNAL_ID_SKIP:
             continue
@@ -568,10 +1094,12 @@ def _get_external_identifiers(tree, orcid) -> tuple[dict[str, str], str | None]:
         if not prefix:
             if id_type not in UNMAPPED_EXTERNAL_ID:
                 UNMAPPED_EXTERNAL_ID.add(id_type)
-                id_url = element.findtext(".//common:external-id-url", namespaces=NAMESPACES)
-                tqdm.write(
-                    f"[{orcid}] unknown id '{id_type}' w/ val "
-                    f"'{local_unique_identifier}' at {id_url}"
+                logger.info(
+                    "[%s] unknown id '%s' w/ val '%s' at %s",
+                    orcid,
+                    id_type,
+                    local_unique_identifier,
+                    id_url,
                 )
             continue
 
@@ -580,163 +1108,107 @@ def _get_external_identifiers(tree, orcid) -> tuple[dict[str, str], str | None]:
 
         rv[prefix] = local_unique_identifier
 
-    for element in tree.findall(
-        ".//researcher-url:researcher-urls/researcher-url:researcher-url", namespaces=NAMESPACES
-    ):
-        name = element.findtext(".//researcher-url:url-name", namespaces=NAMESPACES)
-        url = element.findtext(".//researcher-url:url", namespaces=NAMESPACES).rstrip("/")
+    for name, url in researcher_urls:
+        url = url.rstrip("/")
         if name and homepage is None and _norm_key(name) in PERSONAL_KEYS:
             homepage = url
             continue
-        url = url.removeprefix("https://")
-        url = url.removeprefix("Https://")
-        url = url.removeprefix("http://")
-        if url.startswith("github.com/"):
-            identifier = url.removeprefix("github.com/")
-            identifier = identifier.split("?")[0]  # remove trash like ?tab=repositories
-            if "/" not in identifier:  # i.e., this is not a specific repo
-                rv["github"] = identifier
-        elif url.startswith("www.github.com/"):
-            identifier = url.removeprefix("www.github.com/")
-            if "/" not in identifier:  # i.e., this is not a specific repo
-                rv["github"] = identifier
-        elif url.startswith("twitter.com/") or url.startswith("x.com/"):
-            pass  # skip twitter, it's not reasonable to participate on this platform anymore
-        elif "facebook" in url or "instagram" in url:
+        # both groups are optional, so this always matches
+        match = typing.cast(re.Match[str], URL_PREFIX_RE.match(url))
+        rest = url[match.end() :]
+        url_prefix = match.group(1)
+        if url_prefix not in URL_PREFIXES_BEFORE_SOCIAL_MEDIA and (
+            "facebook" in url or "instagram" in url
+        ):
             continue  # skip social media
-        elif url.startswith("www.wikidata.org/wiki/"):
-            identifier = url.removeprefix("www.wikidata.org/wiki/")
-            rv["wikidata"] = identifier
-        elif url.startswith("tools.wmflabs.org/scholia/author/"):
-            identifier = url.removeprefix("tools.wmflabs.org/scholia/author/")
-            rv["wikidata"] = identifier
-        elif "linkedin.com/in/" in url:  # multiple languages subdomains, so startswith doesn't work
-            identifier = url.rstrip("/").split("linkedin.com/in/")[1]
-            rv["linkedin"] = unquote(identifier)
-        elif "scholar.google" in url:
-            parsed_url = urlparse(url)
-            query_params = parse_qs(parsed_url.query)
-            identifier = query_params.get("user", [None])[0]
-            if identifier:
-                rv["google.scholar"] = identifier
-        elif url.startswith("publons.com/author/"):
-            identifier = url.removeprefix("publons.com/author/").split("/")[0]
-            rv["publons.researcher"] = identifier
-        elif url.startswith("www.researchgate.net/profile/"):
-            identifier = url.removeprefix("www.researchgate.net/profile/")
-            rv["researchgate.profile"] = identifier
-        elif url.startswith("www.scopus.com/authid/detail.uri?authorId="):
-            identifier = url.removeprefix("www.scopus.com/authid/detail.uri?authorId=")
-            rv["scopus"] = identifier
-        elif url.startswith("www.webofscience.com/wos/author/record/"):
-            identifier = url.removeprefix("www.webofscience.com/wos/author/record/")
-            rv["wos.researcher"] = identifier
-        elif url.startswith("lattes.cnpq.br/"):
-            rv["lattes"] = url.removeprefix("lattes.cnpq.br/")
-        elif url.startswith("dialnet.unirioja.es/servlet/autor?codigo="):
-            rv["dialnet.author"] = url.removeprefix("dialnet.unirioja.es/servlet/autor?codigo=")
-        elif url.startswith("papers.ssrn.com/sol3/cf_dev/AbsByAuth.cfm?per_id="):
-            rv["ssrn.author"] = url.removeprefix(
-                "papers.ssrn.com/sol3/cf_dev/AbsByAuth.cfm?per_id="
-            )
-        elif url.startswith("osf.io/"):
-            rv["osf"] = url.removeprefix("osf.io/")
-        elif url.startswith("viaf.org/viaf/"):
-            rv["viaf"] = url.removeprefix("viaf.org/viaf/")
-        elif url.startswith("ieeexplore.ieee.org/author/"):
-            rv["ieee.author"] = url.removeprefix("ieeexplore.ieee.org/author/")
-        elif url.startswith("loop.frontiersin.org/people/"):
-            loop_identifier = (
-                url.removeprefix("loop.frontiersin.org/people/")
-                .removesuffix("/overview")
-                .removesuffix("/bio")
-            )
-            rv["loop"] = loop_identifier
-        elif url.startswith("dblp.org/pid/"):
-            rv["dblp.author"] = url.removeprefix("dblp.org/pid/").removesuffix(".html")
-        elif url.startswith("dblp.uni-trier.de/pid/"):
-            rv["dblp.author"] = url.removeprefix("dblp.uni-trier.de/pid/").removesuffix(".html")
-        elif url.startswith("hub.docker.com/u/"):
-            rv["dockerhub.user"] = url.removeprefix("hub.docker.com/u/")
-        elif name:
-            if name.lower() == "mastodon":
-                try:
-                    host, username = url.rstrip("/").rsplit("/", 1)
-                except ValueError:
-                    tqdm.write(f"[{orcid}] malformed mastodon URL: {url}")
-                else:
-                    host = host.removesuffix("/web")
-                    host = host.removesuffix("/media")
-                    rv["mastodon"] = f"{username}@{host}"
-            else:
-                norm_name = _norm_key(name)
-                UNKNOWN_NAMES[norm_name] += 1
-                UNKNOWN_NAMES_FULL[norm_name] = name
-                UNKNOWN_NAMES_EXAMPLES[norm_name] = url
-        # else, no name, nothing to do here. maybe add some logging?
+        if url_prefix not in URL_PREFIXES_BEFORE_PROFILES and _get_profile_url(rv, url):
+            continue
+        if url_prefix is None:
+            _get_other_researcher_url(rv, name, rest, orcid)
+        elif (pair := URL_PREFIX_PARSERS[url_prefix](rest)) is not None:
+            rv[pair[0]] = pair[1]
 
     return rv, homepage
 
 
-def _get_emails(tree) -> list[str]:
-    return [
-        email.text.strip()
-        for email in tree.findall(".//email:emails/email:email/email:email", namespaces=NAMESPACES)
-    ]
+def _get_profile_url(rv: dict[str, str], url: str) -> bool:
+    """Handle a LinkedIn or Google Scholar URL, and return if it was one."""
+    if "linkedin.com/in/" in url:  # multiple languages subdomains, so startswith doesn't work
+        identifier = url.rstrip("/").split("linkedin.com/in/")[1]
+        rv["linkedin"] = unquote(identifier)
+        return True
+    if "scholar.google" not in url:
+        return False
+    query_params = parse_qs(urlparse(url).query)
+    user: str | None = query_params.get("user", [None])[0]
+    if user is None:
+        return True
+    rv["google.scholar"] = user
+    return True
+
+
+def _get_other_researcher_url(rv: dict[str, str], name: str | None, url: str, orcid: str) -> None:
+    """Handle a researcher URL that doesn't match any rule by its name."""
+    if name:
+        if name.lower() == "mastodon":
+            try:
+                host, username = url.rstrip("/").rsplit("/", 1)
+            except ValueError:
+                logger.debug("[%s] malformed mastodon URL: %s", orcid, url)
+            else:
+                host = host.removesuffix("/web")
+                host = host.removesuffix("/media")
+                rv["mastodon"] = f"{username}@{host}"
+        else:
+            norm_name = _norm_key(name)
+            UNKNOWN_NAMES[norm_name] = UNKNOWN_NAMES.get(norm_name, 0) + 1
+            UNKNOWN_NAMES_FULL[norm_name] = name
+            UNKNOWN_NAMES_EXAMPLES[norm_name] = url
+    # else, no name, nothing to do here. maybe add some logging?
 
 
-def _get_keywords(tree) -> Iterable[str]:
-    return [
-        keyword.text.strip()
-        for keyword in tree.findall(
-            ".//keyword:keywords/keyword:keyword/keyword:content", namespaces=NAMESPACES
-        )
-        if keyword.text
-    ]
+#: Valid ISO 3166-1 alpha-2 country codes
+COUNTRY_CODES = frozenset(_index_by_alpha2())
+#: Country codes that are skipped without a warning. XK is a proposed
+#: code for Kosovo, but isn't valid. Only an issue for a few dozen records
+SKIP_COUNTRY_CODES = frozenset({"XK"})
 
 
-def _get_countries(tree, orcid) -> list[str]:
+def _get_countries(values: Iterable[str], orcid: str) -> list[str]:
     rv = []
-    for country in tree.findall(
-        ".//address:addresses/address:address/address:country", namespaces=NAMESPACES
-    ):
-        value = country.text
-        if not value:
-            continue
+    for value in values:
         value = value.strip().upper()
-        if value == "XK":
-            # XK is a proposed code for Kosovo, but isn't valid.
-            # Only an issue for a few dozen records
-            continue
-        elif value not in _index_by_alpha2():
-            tqdm.write(f"[{orcid}] invalid 2 letter country code: {value}")
-            continue
-        rv.append(value)
+        # check the (overwhelmingly common) valid case first
+        if value in COUNTRY_CODES:
+            rv.append(value)
+        elif value not in SKIP_COUNTRY_CODES:
+            logger.debug("[%s] invalid 2 letter country code: %s", orcid, value)
     return rv
 
 
-def _get_locale(tree, orcid) -> str | None:
-    value = tree.findtext(".//preferences:preferences/preferences:locale", namespaces=NAMESPACES)
-    if value is None:
-        return None
-    return value.strip()
+def _get_work_identifier(element) -> tuple[str | None, str | None]:
+    """Get the type and value of the (first) external identifier for a group of works."""
+    external_id = _find_child(_find_child(element, EXTERNAL_IDS_TAG), EXTERNAL_ID_TAG)
+    return (
+        _find_child_text(external_id, EXTERNAL_ID_TYPE_TAG),
+        _find_child_text(external_id, EXTERNAL_ID_VALUE_TAG),
+    )
 
 
-def _get_works(tree, orcid) -> list[dict[str, str]]:
+def _get_works(
+    work_identifiers: Iterable[tuple[str | None, str | None]], orcid: str
+) -> list[dict[str, str]]:
     # get a subset of all works with pubmed IDs. TODO extend to other IDs
     pmids = set()
-    for g in tree.findall(
-        ".//activities:works/activities:group/common:external-ids", namespaces=NAMESPACES
-    ):
-        if g.findtext(".//common:external-id-type", namespaces=NAMESPACES) == "pmid":
-            value: str | None = g.findtext(".//common:external-id-value", namespaces=NAMESPACES)
+    for id_type, value in work_identifiers:
+        if id_type == "pmid":
             if not value:
                 continue
             value_std = _standardize_pubmed(value)
             if not value_std:
                 continue
             if not value_std.isnumeric():
-                tqdm.write(f"[{orcid}] unstandardized PubMed: '{value}'")
+                logger.debug("[%s] unstandardized PubMed: '%s'", orcid, value)
                 continue
             pmids.add(value_std)
     return [{"pubmed": pmid} for pmid in sorted(pmids)]
@@ -762,6 +1234,15 @@ PUBMED_PREFIXES = [
     "PMID",
     "PMID ",
 ]
+#: Used to reject values without any of the :data:`PUBMED_PREFIXES` in a single C call
+PUBMED_PREFIXES_TUPLE = tuple(PUBMED_PREFIXES)
+#: Matches any of the :data:`PUBMED_PREFIXES` (longest first) and captures the
+#: first token after it
+PUBMED_PREFIX_RE = re.compile(
+    "^(?:"
+    + "|".join(re.escape(prefix) for prefix in sorted(PUBMED_PREFIXES, key=len, reverse=True))
+    + r")\s*(\S+)"
+)
 
 
 def _standardize_pubmed(pubmed: str) -> str | None:
@@ -784,82 +1265,77 @@ def _standardize_pubmed(pubmed: str) -> str | None:
     - a lot with random text (keywords)
     - some with full text citations
     """
+    if pubmed.isdecimal():
+        # fast path for the vast majority of values, which are already clean
+        return pubmed
     pubmed = pubmed.strip().strip(".").rstrip("/").strip()
     if pubmed.isnumeric():
         return pubmed
-    for x in PUBMED_PREFIXES:
-        if pubmed.startswith(x):
-            parts = pubmed.removeprefix(x).strip().split()
-            if parts:
-                return parts[0]
+    if pubmed.startswith(PUBMED_PREFIXES_TUPLE) and (match := PUBMED_PREFIX_RE.match(pubmed)):
+        return match.group(1)
     if pubmed.endswith("E7"):
-        pubmed = str(int(float(pubmed)))
-        return pubmed
+        try:
+            return str(int(float(pubmed)))
+        except ValueError:
+            return None
     return None
 
 
-def _get_employments(tree, grounder: gilda.Grounder):
-    elements = tree.findall(".//employment:employment-summary", namespaces=NAMESPACES)
-    return _get_affiliations(elements, grounder)
-
-
-def _get_educations(tree, grounder: gilda.Grounder):
-    elements = tree.findall(
-        ".//activities:educations//education:education-summary", namespaces=NAMESPACES
-    )
-    return _get_affiliations(elements, grounder)
-
-
-def _get_memberships(tree, grounder: gilda.Grounder):
-    elements = tree.findall(
-        ".//activities:memberships//membership:membership-summary", namespaces=NAMESPACES
-    )
-    return _get_affiliations(elements, grounder)
-
-
-def _get_affiliations(elements, grounder: gilda.Grounder):
-    results = []
-    for element in elements:
-        if element is None:
-            continue
-        organization_element = element.find(".//common:organization", namespaces=NAMESPACES)
-        if organization_element is None:
-            continue
-
-        name = organization_element.findtext(".//common:name", namespaces=NAMESPACES)
-        if not name:
-            continue
-        references = _get_disambiguated_organization(organization_element, name, grounder)
-        record = {"name": name.strip(), "xrefs": references}
-
-        if (start_date := element.find(".//common:start-date", namespaces=NAMESPACES)) is not None:
-            record["start"] = _get_date(start_date)
-        if (end_date := element.find(".//common:end-date", namespaces=NAMESPACES)) is not None:
-            record["end"] = _get_date(end_date)
-
-        if role := _get_role(element):
-            record["role"] = role
+def _get_affiliation(element, grounder: gilda.Grounder) -> dict[str, Any] | None:
+    """Get an affiliation from an employment, education, or membership summary element."""
+    organization_element = _find_child(element, ORGANIZATION_TAG)
+    if organization_element is None:
+        return None
 
-        results.append(record)
-    return results
+    # strip before grounding, so names that only differ in whitespace
+    # share an entry in the cache in :func:`_ground_organization`
+    name = _strip(_find_child_text(organization_element, ORGANIZATION_NAME_TAG))
+    if not name:
+        return None
+    record: dict[str, Any] = {"name": name}
+    if references := _get_disambiguated_organization(organization_element, name, grounder):
+        record["xrefs"] = references
+
+    start_date = _find_child(element, START_DATE_TAG)
+    if start_date is not None and (start := _get_date(start_date)) is not None:
+        record["start"] = start
+    end_date = _find_child(element, END_DATE_TAG)
+    if end_date is not None and (end := _get_date(end_date)) is not None:
+        record["end"] = end
+
+    if role := _get_role(element):
+        record["role"] = role
+
+    return record
+
+
+def _get_date(date_element) -> dict[str, int] | None:
+    """Get a dictionary that can be validated by :class:`Date` from a date element."""
+    # walk the (at most three) children once, rather than looking up each part
+    # separately, since most dates only have a year
+    rv: dict[str, int] = {}
+    for child in date_element:
+        if (key := DATE_PART_KEYS.get(child.tag)) is not None and (
+            value := _get_date_part(child.text)
+        ) is not None:
+            rv[key] = value
+    if "year" not in rv:
+        return None
+    return rv
 
 
-def _get_date(date_element) -> Date | None:
-    year = date_element.findtext(".//common:year", namespaces=NAMESPACES)
-    if year is None:
-        return None
-    month = date_element.findtext(".//common:month", namespaces=NAMESPACES)
-    day = date_element.findtext(".//common:day", namespaces=NAMESPACES)
-    return Date(year=year, month=month, day=day)
+def _get_date_part(text: str | None) -> int | None:
+    """Parse the year, month, or day of a date, skipping it if it's empty or not a number."""
+    if text and (text := text.strip()).isdecimal():
+        return int(text)
+    return None
 
 
 def _get_disambiguated_organization(organization_element, name, grounder) -> dict[str, str]:
     references = {}
-    for de in organization_element.findall(
-        ".//common:disambiguated-organization", namespaces=NAMESPACES
-    ):
-        source = de.findtext(".//common:disambiguation-source", namespaces=NAMESPACES)
-        link = de.findtext(".//common:disambiguated-organization-identifier", namespaces=NAMESPACES)
+    for de in organization_element.iterchildren(DISAMBIGUATED_ORGANIZATION_TAG):
+        source = _find_child_text(de, DISAMBIGUATION_SOURCE_TAG)
+        link = _find_child_text(de, DISAMBIGUATED_ORGANIZATION_ID_TAG)
         if not link:
             continue
         link = link.strip()
@@ -869,23 +1345,36 @@ def _get_disambiguated_organization(organization_element, name, grounder) -> dic
             references[source.lower()] = link
         elif source == "FUNDREF":
             references["funderregistry"] = link.removeprefix("http://dx.doi.org/10.13039/")
-        elif source not in UNKNOWN_SOURCES:
-            tqdm.write(f"unhandled source: {source} / link: {link}")
+        elif source is not None and source not in UNKNOWN_SOURCES:
+            # reported once at the end of parsing, see :func:`iter_records`
             UNKNOWN_SOURCES[source] = link
-    if "ror" not in references and (scored_match := grounder.ground_best(name)):
-        references["ror"] = scored_match.term.id
+    if "ror" not in references and (ror_id := _ground_organization(grounder, name)):
+        references["ror"] = ror_id
     return references
 
 
+@lru_cache(maxsize=1 << 18)
+def _ground_organization(grounder: gilda.Grounder, name: str) -> str | None:
+    """Ground an organization name to ROR.
+
+    Organization names are highly repetitive (e.g., big universities), so this
+    is cached to avoid normalizing and looking up the same names over and over.
+    """
+    if scored_match := grounder.ground_best(name):
+        return scored_match.term.id
+    return None
+
+
 #: Role text needs to be longer than this
 MINIMUM_ROLE_LENGTH = 4
 
 
 def _get_role(element) -> str | None:
-    role = element.findtext(".//common:role-title", namespaces=NAMESPACES)
+    role = _find_child_text(element, ROLE_TITLE_TAG)
     if not role:
         return None
-    role, _ = standardize_role(role)
+    # strip first, so variants that only differ in whitespace share a cache entry
+    role, _ = standardize_role(role.strip())
     if len(role) < MINIMUM_ROLE_LENGTH:
         return None
     return role
@@ -909,118 +1398,272 @@ def ground_researcher_unambiguous(name: str) -> str | None:
 def write_schema() -> None:
     """Write the JSON schema."""
     schema = Record.model_json_schema()
-    SCHEMA_PATH.write_text(json.dumps(schema, indent=2))
+    SCHEMA_PATH.write_bytes(orjson.dumps(schema, option=orjson.OPT_INDENT_2))
+
+
+#: The buffer size for the plain text files written by :func:`write_summaries`
+SUMMARY_BUFFER_SIZE = 1 << 20
+
+#: The number of records sent to a worker process at a time by :func:`write_summaries`
+SUMMARY_BATCH_SIZE = 1_000
+
+
+class _SummaryResult(NamedTuple):
+    """The rows and counts for a batch of records, summarized by a worker."""
+
+    #: the UTF-8 encoded rows for each output file, so the main process can write them as-is
+    emails: bytes
+    githubs: bytes
+    pubmeds: bytes
+    mappings: bytes
+    has_email: int
+    has_github: int
+    xrefs_counter: dict[str, int]
+    affiliation_xrefs_counter: dict[str, int]
+    education_roles: dict[str, int]
+    unstandardized_education_roles: dict[str, int]
+    unstandardized_education_roles_example: dict[str, str]
+    employment_roles: dict[str, int]
+    affiliation_no_ror: dict[str, int]
+    affiliation_no_ror_example: dict[str, str]
+
+
+def _summarize_batch(lines: Iterable[bytes]) -> _SummaryResult:  # noqa:C901
+    """Summarize a batch of JSON lines for records in a worker for :func:`write_summaries`.
+
+    The lines are loaded as plain dictionaries, like in :func:`iter_record_dicts`,
+    since validating each as a :class:`Record` takes several times longer than
+    everything else done here. Like in the records file, empty fields may be missing.
+    """
+    has_email = 0
+    has_github = 0
+    # plain defaultdict increments are about three times cheaper than Counter's, which
+    # matters in this loop over every record
+    xrefs_counter: defaultdict[str, int] = defaultdict(int)
+    affiliation_xrefs_counter: defaultdict[str, int] = defaultdict(int)
+    education_roles: defaultdict[str, int] = defaultdict(int)
+    unstandardized_education_roles: defaultdict[str, int] = defaultdict(int)
+    unstandardized_education_roles_example: dict[str, str] = {}
+    employment_roles: defaultdict[str, int] = defaultdict(int)
+    affiliation_no_ror: defaultdict[str, int] = defaultdict(int)
+    affiliation_no_ror_example: dict[str, str] = {}
+
+    emails_file = io.StringIO()
+    emails_writer = csv.writer(emails_file, delimiter="\t")
+    githubs_file = io.StringIO()
+    githubs_writer = csv.writer(githubs_file, delimiter="\t")
+    pubmeds_file = io.StringIO()
+    pubmeds_writer = csv.writer(pubmeds_file, delimiter="\t")
+    sssom_file = io.StringIO()
+    sssom_writer = csv.writer(sssom_file, delimiter="\t")
+
+    # bind the write method once, since it's called for most records
+    write_mappings = sssom_writer.writerows
+    sssom_line_terminator = sssom_writer.dialect.lineterminator
+
+    for line in lines:
+        record = orjson.loads(line)
+        orcid = record["orcid"]
+        name = record["name"]
+
+        if emails := record.get("emails"):
+            has_email += 1
+            _write_orcid_rows(emails_file, emails_writer, orcid, emails)
+
+        # most records have no cross-references, so skip the mapping bookkeeping
+        if xrefs := record.get("xrefs"):
+            if not _needs_quoting(name) and not any(map(_needs_quoting, xrefs.values())):
+                # assemble the rows directly, since there's nothing for csv to quote
+                sssom_file.write(
+                    "".join(
+                        f"orcid:{orcid}\t{name}\tskos:exactMatch\t{k}:{v}"
+                        f"\tsemapv:ManualMappingCuration{sssom_line_terminator}"
+                        for k, v in xrefs.items()
+                    )
+                )
+            else:
+                write_mappings(
+                    (
+                        f"orcid:{orcid}",
+                        name,
+                        "skos:exactMatch",
+                        f"{k}:{v}",
+                        "semapv:ManualMappingCuration",
+                    )
+                    for k, v in xrefs.items()
+                )
+
+            if github := xrefs.get("github"):
+                _write_orcid_rows(githubs_file, githubs_writer, orcid, [github])
+                has_github += 1
+
+            for k in xrefs:
+                xrefs_counter[k] += 1
+
+        for education in record.get("educations", ()):
+            if role := education.get("role"):
+                role_std, did_std = standardize_role(role)
+                education_roles[role_std] += 1
+                if not did_std:
+                    unstandardized_education_roles[role] += 1
+                    if role not in unstandardized_education_roles_example:
+                        unstandardized_education_roles_example[role] = orcid
+            _tally_affiliation(
+                education,
+                orcid,
+                affiliation_xrefs_counter,
+                affiliation_no_ror,
+                affiliation_no_ror_example,
+            )
+
+        for employment in record.get("employments", ()):
+            if role := employment.get("role"):
+                employment_roles[role] += 1
+            _tally_affiliation(
+                employment,
+                orcid,
+                affiliation_xrefs_counter,
+                affiliation_no_ror,
+                affiliation_no_ror_example,
+            )
+
+        for membership in record.get("memberships", ()):
+            # TODO role standardization?
+            _tally_affiliation(
+                membership, orcid, None, affiliation_no_ror, affiliation_no_ror_example
+            )
+
+        if pubmeds := [
+            pubmed
+            for work in record.get("works", ())
+            if (pubmed := _standardize_pubmed(work["pubmed"]))
+        ]:
+            _write_orcid_rows(pubmeds_file, pubmeds_writer, orcid, pubmeds)
+
+    return _SummaryResult(
+        emails_file.getvalue().encode("utf-8"),
+        githubs_file.getvalue().encode("utf-8"),
+        pubmeds_file.getvalue().encode("utf-8"),
+        sssom_file.getvalue().encode("utf-8"),
+        has_email,
+        has_github,
+        xrefs_counter,
+        affiliation_xrefs_counter,
+        education_roles,
+        unstandardized_education_roles,
+        unstandardized_education_roles_example,
+        employment_roles,
+        affiliation_no_ror,
+        affiliation_no_ror_example,
+    )
+
+
+def _encode_header(*columns: str) -> bytes:
+    """Encode a header row like :mod:`csv` would write it in a tab-separated file."""
+    return ("\t".join(columns) + csv.excel.lineterminator).encode("utf-8")
 
 
-def write_summaries(*, force: bool = False):  # noqa:C901
-    """Write summary files."""
+def _add_counts(counter: defaultdict[str, int], counts: dict[str, int]) -> None:
+    for key, count in counts.items():
+        counter[key] += count
+
+
+def _add_examples(examples: dict[str, str], new_examples: dict[str, str]) -> None:
+    # batches are merged in order, so keeping the first example seen
+    # gives the same result as summarizing serially
+    for key, example in new_examples.items():
+        examples.setdefault(key, example)
+
+
+def write_summaries(*, force: bool = False):
+    """Write summary files.
+
+    The records are summarized in batches by a pool of worker processes, whose
+    rows and counts are combined in order, so the output is the same as if the
+    records were summarized one at a time.
+    """
     from tabulate import tabulate
 
     # count affiliations (breakdown by employer, education, combine)
     # count roles
     # count records with email
 
+    if force or not RECORDS_PATH.is_file():
+        # parse the records up front, so the summary workers aren't
+        # forked while the parsing workers are still running
+        deque(_parse_records(RECORDS_PATH), maxlen=0)
+
     has_email = 0
     has_github = 0
-    xrefs_counter: Counter[str] = Counter()
-    affiliation_xrefs_counter: Counter[str] = Counter()
-    education_roles: Counter[str] = Counter()
-    unstandardized_education_roles: Counter[str] = Counter()
+    xrefs_counter: defaultdict[str, int] = defaultdict(int)
+    affiliation_xrefs_counter: defaultdict[str, int] = defaultdict(int)
+    education_roles: defaultdict[str, int] = defaultdict(int)
+    unstandardized_education_roles: defaultdict[str, int] = defaultdict(int)
     unstandardized_education_roles_example: dict[str, str] = {}
-    employment_roles: Counter[str] = Counter()
-    affiliation_no_ror: Counter[str] = Counter()
+    employment_roles: defaultdict[str, int] = defaultdict(int)
+    affiliation_no_ror: defaultdict[str, int] = defaultdict(int)
     affiliation_no_ror_example: dict[str, str] = {}
+    max_workers = _get_max_workers()
     with (
-        open(GITHUBS_PATH, "w") as githubs_file,
-        open(EMAIL_PATH, "w") as emails_file,
-        gzip.open(PUBMEDS_PATH, "wt") as pubmeds_file,
-        gzip.open(SSSOM_PATH, "wt") as sssom_file,
+        ProcessPoolExecutor(max_workers=max_workers) as executor,
+        # the workers send encoded rows, so skip text mode's encoding layer
+        open(GITHUBS_PATH, "wb", buffering=SUMMARY_BUFFER_SIZE) as githubs_file,
+        open(EMAIL_PATH, "wb", buffering=SUMMARY_BUFFER_SIZE) as emails_file,
+        # these are the biggest outputs, so favor compression speed over size
+        gzip_impl.open(PUBMEDS_PATH, "wb", compresslevel=1) as pubmeds_file,
+        gzip_impl.open(SSSOM_PATH, "wb", compresslevel=1) as sssom_file,
     ):
-        emails_writer = csv.writer(emails_file, delimiter="\t")
-        emails_writer.writerow(("orcid", "email"))
-        githubs_writer = csv.writer(githubs_file, delimiter="\t")
-        githubs_writer.writerow(("orcid", "github"))
-        pubmeds_writer = csv.writer(pubmeds_file, delimiter="\t")
-        pubmeds_writer.writerow(("orcid", "pubmed"))
+        # start the workers before reading the records spawns any other threads
+        executor.submit(os.getpid).result()
+
+        emails_file.write(_encode_header("orcid", "email"))
+        githubs_file.write(_encode_header("orcid", "github"))
+        pubmeds_file.write(_encode_header("orcid", "pubmed"))
         # TODO write out bioregistry prefixes in sssom_file
-        sssom_writer = csv.writer(sssom_file, delimiter="\t")
-        sssom_writer.writerow(
-            ("subject_id", "subject_label", "predicate_id", "object_id", "mapping_justification")
+        sssom_file.write(
+            _encode_header(
+                "subject_id", "subject_label", "predicate_id", "object_id", "mapping_justification"
+            )
         )
 
-        for record in iter_records(force=force, desc="Writing summaries"):
-            if record.emails:
-                has_email += 1
-                for email in record.emails:
-                    emails_writer.writerow((record.orcid, email))
-
-            sssom_writer.writerows(
-                (
-                    f"orcid:{record.orcid}",
-                    record.name,
-                    "skos:exactMatch",
-                    f"{k}:{v}",
-                    "semapv:ManualMappingCuration",
-                )
-                for k, v in sorted(record.xrefs.items())
+        results = _imap_bounded(
+            executor,
+            _summarize_batch,
+            batched(_iter_record_lines(desc="Writing summaries"), SUMMARY_BATCH_SIZE),
+            # keep a few batches queued per worker so none go idle
+            max_pending=4 * max_workers,
+        )
+        for result in results:
+            emails_file.write(result.emails)
+            githubs_file.write(result.githubs)
+            pubmeds_file.write(result.pubmeds)
+            sssom_file.write(result.mappings)
+            has_email += result.has_email
+            has_github += result.has_github
+            _add_counts(xrefs_counter, result.xrefs_counter)
+            _add_counts(affiliation_xrefs_counter, result.affiliation_xrefs_counter)
+            _add_counts(education_roles, result.education_roles)
+            _add_counts(unstandardized_education_roles, result.unstandardized_education_roles)
+            _add_examples(
+                unstandardized_education_roles_example,
+                result.unstandardized_education_roles_example,
             )
-
-            if github := record.xrefs.get("github"):
-                githubs_writer.writerow((record.orcid, github))
-                has_github += 1
-
-            for k in record.xrefs:
-                xrefs_counter[k] += 1
-
-            for education in record.educations:
-                if education.role:
-                    role_std, did_std = standardize_role(education.role)
-                    education_roles[role_std] += 1
-                    if not did_std:
-                        unstandardized_education_roles[education.role] += 1
-                        if education.role not in unstandardized_education_roles_example:
-                            unstandardized_education_roles_example[education.role] = record.orcid
-                for k in education.xrefs:
-                    affiliation_xrefs_counter[k] += 1
-                if "ror" not in education.xrefs:  # and not grounder.ground(education.name):
-                    affiliation_no_ror[education.name] += 1
-                    if education.name not in affiliation_no_ror_example:
-                        affiliation_no_ror_example[education.name] = record.orcid
-
-            for employment in record.employments:
-                if employment.role:
-                    employment_roles[employment.role] += 1
-                for k in employment.xrefs:
-                    affiliation_xrefs_counter[k] += 1
-                if "ror" not in employment.xrefs:  # and not grounder.ground(education.name):
-                    affiliation_no_ror[employment.name] += 1
-                    if employment.name not in affiliation_no_ror_example:
-                        affiliation_no_ror_example[employment.name] = record.orcid
-
-            for membership in record.memberships:
-                # TODO role standardization?
-                if "ror" not in employment.xrefs:  # and not grounder.ground(education.name):
-                    affiliation_no_ror[membership.name] += 1
-                    if membership.name not in affiliation_no_ror_example:
-                        affiliation_no_ror_example[membership.name] = record.orcid
-
-            for work in record.works:
-                pubmed = _standardize_pubmed(work.pubmed)
-                if pubmed:
-                    pubmeds_writer.writerow((record.orcid, pubmed))
+            _add_counts(employment_roles, result.employment_roles)
+            _add_counts(affiliation_no_ror, result.affiliation_no_ror)
+            _add_examples(affiliation_no_ror_example, result.affiliation_no_ror_example)
 
     XREFS_SUMMARY_PATH.write_text(
         f"""\
 # Cross References Summary
 
-{tabulate(xrefs_counter.most_common(), tablefmt='github', headers=['prefix', 'count'])}
+{tabulate(_most_common(xrefs_counter), tablefmt='github', headers=['prefix', 'count'])}
     """.rstrip()
     )
 
     with AFFILIATION_XREFS_SUMMARY_PATH.open("w") as file:
         write_counter(file, ("prefix", "count"), affiliation_xrefs_counter)
 
-    with gzip.open(EDUCATION_ROLE_SUMMARY_PATH, "wt") as file:
+    with gzip_impl.open(EDUCATION_ROLE_SUMMARY_PATH, "wt") as file:
         write_counter(file, ("role", "count"), education_roles)
 
     with open(EDUCATION_ROLE_UNSTANDARDIZED_SUMMARY_PATH, "w") as file:
@@ -1036,19 +1679,63 @@ def write_summaries(*, force: bool = False):  # noqa:C901
             file, ("name", "count"), affiliation_no_ror, examples=affiliation_no_ror_example
         )
 
-    with gzip.open(EMPLOYMENT_ROLE_SUMMARY_PATH, "wt") as file:
+    with gzip_impl.open(EMPLOYMENT_ROLE_SUMMARY_PATH, "wt") as file:
         write_counter(file, ("role", "count"), employment_roles)
 
 
+def _tally_affiliation(
+    affiliation: dict[str, Any],
+    orcid: str,
+    xrefs_counter: defaultdict[str, int] | None,
+    no_ror_counter: defaultdict[str, int],
+    no_ror_examples: dict[str, str],
+) -> None:
+    """Count an affiliation's cross-references and track it if it's missing a ROR."""
+    xrefs = affiliation.get("xrefs", {})
+    if xrefs_counter is not None:
+        # a plain loop beats Counter.update here, whose Mapping check dominates for a
+        # handful of keys
+        for key in xrefs:
+            xrefs_counter[key] += 1
+    if "ror" not in xrefs:  # and not grounder.ground(name):
+        name = affiliation["name"]
+        no_ror_counter[name] += 1
+        if name not in no_ror_examples:
+            no_ror_examples[name] = orcid
+
+
+#: Matches characters that :mod:`csv` would quote in a tab-separated file
+_TSV_SPECIAL_RE = re.compile(r'[\t\n\r"]')
+
+
+def _needs_quoting(value: str) -> bool:
+    """Check if a value would be quoted by :mod:`csv` in a tab-separated file."""
+    return _TSV_SPECIAL_RE.search(value) is not None
+
+
+def _write_orcid_rows(file, writer, orcid: str, values: list[str]) -> None:
+    """Write a row pairing the ORCID with each value, bypassing :mod:`csv` when possible."""
+    if any(map(_needs_quoting, values)):
+        writer.writerows((orcid, value) for value in values)
+    else:
+        line_terminator = writer.dialect.lineterminator
+        file.write("".join(f"{orcid}\t{value}{line_terminator}" for value in values))
+
+
+def _most_common(counts: Mapping[str, int]) -> list[tuple[str, int]]:
+    """Sort counts from most to least common, like :meth:`collections.Counter.most_common`."""
+    return sorted(counts.items(), key=itemgetter(1), reverse=True)
+
+
 def write_counter(file, header, counter, examples=None) -> None:
     """Write a counter to a TSV file."""
     writer = csv.writer(file, delimiter="\t")
     if examples is not None:
         writer.writerow((*header, "example"))
-        writer.writerows((k, count, examples.get(k)) for k, count in counter.most_common())
+        writer.writerows((k, count, examples.get(k)) for k, count in _most_common(counter))
     else:
         writer.writerow(header)
-        writer.writerows(counter.most_common())
+        writer.writerows(_most_common(counter))
 
 
 def _process_example() -> Record | None:
@@ -1061,9 +1748,11 @@ def _process_example() -> Record | None:
     grounder = gilda.Grounder([])
     orcid_to_wikimedia_commons = get_orcid_to_commons_image()
     orcid_to_wikidata = get_orcid_to_wikidata()
-    with example_path.open() as file:
+    with example_path.open("rb") as file:
         res = _process_file(file, grounder, orcid_to_wikidata, orcid_to_wikimedia_commons)
-    return res
+    if res is None:
+        return None
+    return Record.model_validate(res)
 
 
 def _main():
@@ -1079,7 +1768,7 @@ def _main():
     write_owl_rdf()
     tqdm.write("Generating Gilda TSV (~30 min)")
     write_gilda()
-    tqdm.write("Generating Gilda SQLite (~30 min)")
+    tqdm.write("Generating Gilda SQLite from the Gilda TSV")
     write_lexical()
     print(*ground_researcher("CT Hoyt"), sep="\n")  # noqa:T201
 
@@ -3,22 +3,25 @@
 from __future__ import annotations
 
 import csv
-import gzip
-import json
+import os
 import sqlite3
+import threading
 from collections.abc import Iterable
 from contextlib import closing
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from itertools import batched
+from pathlib import Path
 
 import gilda
+import orjson
 import pandas as pd
 from gilda import Grounder, ScoredMatch, Term
 from gilda.resources.sqlite_adapter import SqliteEntries
 from gilda.term import TERMS_HEADER
 from tqdm import tqdm
 
-from orcid_downloader.api import MODULE, Record, iter_records
+from orcid_downloader._compat import gzip_impl
+from orcid_downloader.api import MODULE, RECORDS_PATH, Record, iter_records
 from orcid_downloader.name_utils import name_to_synonyms
 
 __all__ = [
@@ -42,36 +45,62 @@ def get_orcid_grounder() -> Grounder:
 class UngroupedSqliteEntries(SqliteEntries, dict):
     """An interface to the SQLite lexical index compatible with Gilda."""
 
+    @cached_property
+    def _connections(self) -> dict[tuple[int, int], sqlite3.Connection]:
+        return {}
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get a read-only connection to the lexical index for the current thread.
+
+        Connections are reused, since opening one costs much more than an indexed lookup
+        and the grounder does a lookup for each synonym of each query. Each thread gets its
+        own, and so does each forked process, since a connection can't be carried over
+        a fork.
+        """
+        key = os.getpid(), threading.get_ident()
+        connection = self._connections.get(key)
+        if connection is None:
+            uri = f"{Path(self.db).resolve().as_uri()}?mode=ro"
+            # the connection is only used by this thread, but not checking the thread
+            # lets close() be called from any thread
+            connection = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._connections[key] = connection
+        return connection
+
+    def close(self) -> None:
+        """Close the connections to the lexical index opened by this process."""
+        pid = os.getpid()
+        for key in list(self._connections):
+            # leave the ones inherited from a parent process alone
+            if key[0] == pid:
+                self._connections.pop(key).close()
+
     def get(self, key, default=None):
         """Get a term from the lexical index."""
-        with sqlite3.connect(self.db) as conn:
-            res = conn.execute("SELECT term FROM terms WHERE norm_text=?", (key,))
-            terms = res.fetchall()
-            if not terms:
-                return default
-            return [Term(**json.loads(term)) for (term,) in terms]
+        res = self._get_connection().execute("SELECT term FROM terms WHERE norm_text=?", (key,))
+        terms = res.fetchall()
+        if not terms:
+            return default
+        return [Term(**orjson.loads(term)) for (term,) in terms]
 
     def values(self):
         """Iterate over the terms in the lexical index."""
-        with sqlite3.connect(self.db) as conn:
-            res = conn.execute("SELECT term FROM terms")
-            for (result,) in res.fetchall():
-                yield Term(**json.loads(result))
+        res = self._get_connection().execute("SELECT term FROM terms")
+        for (result,) in res.fetchall():
+            yield Term(**orjson.loads(result))
 
     def __len__(self) -> int:
         """Get the number of unique keys in the lexical index."""
-        with sqlite3.connect(self.db) as conn:
-            res = conn.execute("SELECT COUNT(DISTINCT norm_text) FROM terms")
-            return res.fetchone()[0]
+        res = self._get_connection().execute("SELECT COUNT(DISTINCT norm_text) FROM terms")
+        return res.fetchone()[0]
 
     def __iter__(self):
         """Iterate over the keys in the lexical index."""
-        with sqlite3.connect(self.db) as conn:
-            res = conn.execute("SELECT DISTINCT norm_text FROM terms")
-            for (norm_text,) in tqdm(
-                res.fetchall(), desc="Iterating over lexical index", unit_scale=True
-            ):
-                yield norm_text
+        res = self._get_connection().execute("SELECT DISTINCT norm_text FROM terms")
+        for (norm_text,) in tqdm(
+            res.fetchall(), desc="Iterating over lexical index", unit_scale=True
+        ):
+            yield norm_text
 
 
 class ORCIDGrounder(Grounder):
@@ -92,8 +121,17 @@ class ORCIDGrounder(Grounder):
         return []
 
 
-def write_lexical():
-    """Build a SQLite database file from a set of grounding entries."""
+def write_lexical(*, force: bool = False) -> None:
+    """Build a SQLite database file from a set of grounding entries.
+
+    :param force: Should the Gilda TSV be rebuilt from the records first?
+
+    This reads the terms from the TSV written by :func:`write_gilda`, so all the
+    records don't have to be loaded and expanded with synonyms a second time.
+    The TSV is rebuilt first if it doesn't exist yet or is older than the records.
+    """
+    if force or _is_outdated(GILDA_PATH):
+        write_gilda()
     if GILDA_DB_PATH.is_file():
         GILDA_DB_PATH.unlink()
     with sqlite3.connect(GILDA_DB_PATH) as conn:
@@ -103,10 +141,8 @@ def write_lexical():
             cur.execute(q)
 
         rows = (
-            (term.norm_text, json.dumps(term.to_json()))
-            for record in iter_records(desc="Writing Gilda SQLite index")
-            if record.name
-            for term in _record_to_gilda_terms(record)
+            (term.norm_text, orjson.dumps(term.to_json()).decode())
+            for term in _iter_gilda_terms(desc="Writing Gilda SQLite index")
         )
         for x in batched(rows, 1_000_000):
             df = pd.DataFrame(x, columns=["norm_text", "term"])
@@ -124,8 +160,8 @@ def write_gilda() -> None:
     """Write Gilda indexes."""
     tqdm.write("indexing for gilda")
     with (
-        gzip.open(GILDA_PATH, "wt") as gilda_file,
-        gzip.open(GILDA_HQ_PATH, "wt") as gilda_hq_file,
+        gzip_impl.open(GILDA_PATH, "wt") as gilda_file,
+        gzip_impl.open(GILDA_HQ_PATH, "wt") as gilda_hq_file,
     ):
         writer = csv.writer(gilda_file, delimiter="\t")
         hq_writer = csv.writer(gilda_hq_file, delimiter="\t")
@@ -145,6 +181,23 @@ def write_gilda() -> None:
     tqdm.write("done indexing for gilda")
 
 
+def _is_outdated(path: Path) -> bool:
+    """Check if a file derived from the records is missing or older than the records."""
+    if not path.is_file():
+        return True
+    return RECORDS_PATH.is_file() and path.stat().st_mtime < RECORDS_PATH.stat().st_mtime
+
+
+def _iter_gilda_terms(desc: str) -> Iterable[gilda.Term]:
+    """Iterate over the terms in the TSV written by :func:`write_gilda`."""
+    with gzip_impl.open(GILDA_PATH, "rt") as file:
+        reader = csv.reader(file, delimiter="\t")
+        next(reader)  # skip the header
+        for row in tqdm(reader, unit_scale=True, unit="term", desc=desc):
+            # csv writes None as an empty string, so turn those back
+            yield Term(*(value or None for value in row))
+
+
 def _record_to_gilda_terms(record: Record) -> Iterable[gilda.Term]:
     from gilda import Term
     from gilda.process import normalize
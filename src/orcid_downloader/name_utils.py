@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import re
 from collections.abc import Iterable
+from functools import lru_cache
 from string import ascii_lowercase
 
 __all__ = [
@@ -11,6 +13,17 @@ __all__ = [
 ]
 
 
+#: Titles at the start of a name, possibly several, like in "Prof. Dr. Jane Doe"
+TITLE_PREFIX_RE = re.compile(r"^(?:(?:professor|dr)\s+|(?:prof|dr)\.\s*)+", re.IGNORECASE)
+#: Titles and degrees at the end of a name, possibly several, like in "Jane Doe, MD, PhD".
+#: Degrees are only stripped after a name with more than one token, since e.g. in
+#: "Rahman, Md", the part after the comma is a given name (short for Muhammad)
+TITLE_SUFFIX_RE = re.compile(
+    r"(?:\s*\(dr\.?\)|\s*,\s*(?:m\.d\.|ph\.?d\.?|md|mph|ms))+\s*$", re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=65536)
 def clean_name(name: str) -> str:
     """Clean a name string.
 
@@ -19,28 +32,12 @@ def clean_name(name: str) -> str:
     """
     # strip titles like Dr. and DR. from beginning of all names/aliases
     # strip post-titles Francess Dufie Azumah (DR.)
-    lower = name.lower()
-    if lower.startswith("professor "):
-        name = name[len("professor ") :].strip()
-    if lower.startswith("prof."):
-        name = name[len("prof.") :].strip()
-    if lower.startswith("dr "):
-        name = name[len("dr ") :]
-    if lower.startswith("dr."):
-        name = name[len("dr.") :].strip()
-
-    for suffix in [
-        "(dr)",
-        "(dr.)",
-        ", m.d.",
-        ", phd",
-        ", md",
-        ", mph",
-        ", ph.d.",
-        ", ms",
-    ]:
-        if lower.endswith(suffix):
-            name = name.removesuffix(suffix).strip()
+    name = TITLE_PREFIX_RE.sub("", name)
+    if (match := TITLE_SUFFIX_RE.search(name)) and (
+        "," not in match.group() or len(name[: match.start()].split()) > 1
+    ):
+        name = name[: match.start()]
+    name = name.strip()
 
     name = name.replace('"', "")
     name = name.strip("/")
@@ -89,55 +86,66 @@ def name_to_synonyms(name: str) -> Iterable[str]:
     """Create a synonym list from a full name.
 
     :param name: A person's name
-    :yield: Variations on the name
+    :yield: Unique variations on the name
     """
+    # many of the forms coincide, e.g., all the initials-based ones when
+    # there's only one given name, so only yield each of them once
+    yield from dict.fromkeys(_iter_name_forms(name))
+
+
+def _iter_name_forms(name: str) -> Iterable[str]:
     # assume last part is the last name, this isn't always correct, but :shrug:
     # consider alternatives like https://pypi.org/project/nameparser/
     *givens, family = name.split()
     if not givens:
         return
 
-    yield family + ", " + givens[0]
-    yield family + ", " + " ".join(givens)
+    # compute the initials (and their joined forms) once, and build each
+    # form with a single f-string rather than a chain of concatenations
+    firsts = [given[0] for given in givens]
+    firsts_dotted = [f"{first}." for first in firsts]
+    first_first = firsts[0]
+
+    yield f"{family}, {givens[0]}"
+    yield f"{family}, {' '.join(givens)}"
 
     if len(givens) > 1:
-        first_given, *middle_givens = givens
-        middle_given_initials = [g[0] for g in middle_givens]
-        yield family + ", " + first_given + " " + " ".join(middle_given_initials)
-        yield family + ", " + first_given + " " + "".join(f"{i}." for i in middle_given_initials)
-        yield family + ", " + first_given + " " + " ".join(f"{i}." for i in middle_given_initials)
-
-        yield first_given + " " + " ".join(middle_given_initials) + " " + family
-        yield first_given + " " + "".join(f"{i}." for i in middle_given_initials) + " " + family
-        yield first_given + " " + " ".join(f"{i}." for i in middle_given_initials) + " " + family
+        first_given = givens[0]
+        middle_spaced = " ".join(firsts[1:])
+        middle_dotted_unspaced = "".join(firsts_dotted[1:])
+        middle_dotted_spaced = " ".join(firsts_dotted[1:])
+        yield f"{family}, {first_given} {middle_spaced}"
+        yield f"{family}, {first_given} {middle_dotted_unspaced}"
+        yield f"{family}, {first_given} {middle_dotted_spaced}"
+
+        yield f"{first_given} {middle_spaced} {family}"
+        yield f"{first_given} {middle_dotted_unspaced} {family}"
+        yield f"{first_given} {middle_dotted_spaced} {family}"
 
-    firsts = [given[0] for given in givens]
     firsts_unspaced = "".join(firsts)
     firsts_spaced = " ".join(firsts)
-    firsts_dotted = [f"{first}." for first in firsts]
     firsts_dotted_unspaced = "".join(firsts_dotted)
     firsts_dotted_spaced = " ".join(firsts_dotted)
-    first_first = firsts[0]
 
-    yield first_first + " " + family
-    yield first_first + ". " + family
+    yield f"{first_first} {family}"
+    yield f"{first_first}. {family}"
 
-    yield firsts_unspaced + " " + family
-    yield firsts_spaced + " " + family
-    yield firsts_dotted_unspaced + " " + family
-    yield firsts_dotted_spaced + " " + family
+    yield f"{firsts_unspaced} {family}"
+    yield f"{firsts_spaced} {family}"
+    yield f"{firsts_dotted_unspaced} {family}"
+    yield f"{firsts_dotted_spaced} {family}"
 
-    yield family + " " + firsts_unspaced
-    yield family + " " + firsts_dotted_unspaced
-    yield family + " " + firsts_spaced
-    yield family + " " + firsts_dotted_spaced
+    yield f"{family} {firsts_unspaced}"
+    yield f"{family} {firsts_dotted_unspaced}"
+    yield f"{family} {firsts_spaced}"
+    yield f"{family} {firsts_dotted_spaced}"
 
-    yield family + ", " + firsts_unspaced
-    yield family + ", " + firsts_dotted_unspaced
-    yield family + ", " + firsts_spaced
-    yield family + ", " + firsts_dotted_spaced
+    yield f"{family}, {firsts_unspaced}"
+    yield f"{family}, {firsts_dotted_unspaced}"
+    yield f"{family}, {firsts_spaced}"
+    yield f"{family}, {firsts_dotted_spaced}"
 
-    yield family + " " + first_first
-    yield family + " " + first_first + "."
-    yield family + ", " + first_first + "."
-    yield family + ", " + first_first
+    yield f"{family} {first_first}"
+    yield f"{family} {first_first}."
+    yield f"{family}, {first_first}."
+    yield f"{family}, {first_first}"
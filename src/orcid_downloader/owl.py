@@ -1,10 +1,9 @@
 """Write OWL."""
 
-import gzip
-
 import pyobo
 from tqdm import tqdm
 
+from orcid_downloader._compat import gzip_impl
 from orcid_downloader.api import MODULE, iter_records
 
 __all__ = [
@@ -84,7 +83,7 @@ def write_owl_rdf() -> None:  # noqa:C901
     ror_id_to_name = {k: v.replace('"', '\\"') for k, v in pyobo.get_id_name_mapping("ror").items()}
     ror_written = set()
 
-    with gzip.open(PATH, "wt") as file:
+    with gzip_impl.open(PATH, "wt") as file:
         file.write(PREAMBLE + "\n")
         for record in iter_records(desc="Writing OWL RDF"):
             if not record.name:
@@ -15,6 +15,8 @@
        }
 """
 
+from functools import lru_cache
+
 __all__ = [
     "standardize_role",
 ]
@@ -674,6 +676,7 @@ for k in REVERSE_REPLACEMENTS:
 REPLACEMENTS = {_norm(value): k for k, values in REVERSE_REPLACEMENTS.items() for value in values}
 
 
+@lru_cache(maxsize=131072)
 def standardize_role(role: str) -> tuple[str, bool]:
     """Standardize a role string."""
     role = role.strip()
@@ -697,13 +700,13 @@ def standardize_role(role: str) -> tuple[str, bool]:
             if beginning in REPLACEMENTS:
                 return REPLACEMENTS[beginning], True
 
-    if role_norm.startswith("bscin") or role_norm.startswith("bsc "):
+    if role_norm.startswith(("bscin", "bsc ")):
         return "Bachelor of Science", True
-    if role_norm.startswith("mscin") or role_norm.startswith("msc "):
+    if role_norm.startswith(("mscin", "msc ")):
         return "Master of Science", True
-    if role_norm.startswith("main") or role_norm.startswith("ma "):
+    if role_norm.startswith(("main", "ma ")):
         return "Master of Arts", True
-    if role_norm.startswith("phdin") or role_norm.startswith("phd student in "):
+    if role_norm.startswith(("phdin", "phd student in ")):
         return "Doctor of Philosophy", True
 
     return role, False
@@ -0,0 +1,416 @@
+"""Tests for the ORCID processing API."""
+
+import gzip
+import io
+import multiprocessing
+import re
+import sys
+import unittest
+from functools import lru_cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+import orjson
+
+from orcid_downloader import api
+from orcid_downloader.api import (
+    Record,
+    _get_executor,
+    _get_external_identifiers,
+    _get_name_and_aliases,
+    _process_batch,
+    _process_file,
+    _standardize_pubmed,
+    _validate_mapping,
+)
+
+HERE = Path(__file__).parent.resolve()
+EXAMPLE_PATH = HERE.parent.joinpath("example.xml")
+EXAMPLE_ORCID = "0000-0003-4423-4370"
+
+
+class TestMapping(unittest.TestCase):
+    """Test the mappings used when processing records."""
+
+    def test_external_id_mapping(self):
+        """Test the external identifier mapping only uses standard Bioregistry prefixes."""
+        _validate_mapping()
+
+
+class TestExternalIdentifiers(unittest.TestCase):
+    """Test parsing external identifiers."""
+
+    def test_external_identifiers(self):
+        """Test external identifiers are mapped to Bioregistry prefixes."""
+        self.assertEqual(
+            ({"scopus": "1234567", "wos.researcher": "ABC-1234-2020"}, None),
+            _get_external_identifiers(
+                [
+                    ("Scopus Author ID", "1234567", "https://www.scopus.com"),
+                    ("ResearcherID:", "ABC-1234-2020", None),
+                    ("ORCID", "0000-0000-0000-0000", None),
+                    ("Unknown ID", "1234567", None),
+                    ("Loop profile", None, None),
+                    (None, "1234567", None),
+                ],
+                [],
+                "0000-0000-0000-0000",
+            ),
+        )
+
+
+class TestResearcherURLs(unittest.TestCase):
+    """Test parsing researcher URLs into external identifiers."""
+
+    def test_urls(self):
+        """Test the URL rules, in the order they're applied."""
+        for name, url, expected in [
+            (None, "https://github.com/cthoyt", {"github": "cthoyt"}),
+            (None, "https://github.com/cthoyt?tab=repositories", {"github": "cthoyt"}),
+            (None, "https://github.com/cthoyt/orcid_downloader", {}),
+            (None, "http://www.github.com/cthoyt/", {"github": "cthoyt"}),
+            (None, "Https://github.com/cthoyt", {"github": "cthoyt"}),
+            (None, "HTTPS://github.com/cthoyt", {"github": "cthoyt"}),
+            (None, "github.com/cthoyt", {"github": "cthoyt"}),
+            # prefix rules before the social media skip still win
+            (None, "https://github.com/facebook", {"github": "facebook"}),
+            (None, "https://twitter.com/cthoyt", {}),
+            (None, "https://x.com/cthoyt", {}),
+            (None, "https://www.facebook.com/cthoyt", {}),
+            (None, "https://www.instagram.com/cthoyt", {}),
+            # the social media skip wins over the prefix rules after it
+            (None, "https://publons.com/author/instagram", {}),
+            (None, "https://www.researchgate.net/profile/facebook", {}),
+            (None, "https://www.wikidata.org/wiki/Q47475003", {"wikidata": "Q47475003"}),
+            (
+                None,
+                "https://tools.wmflabs.org/scholia/author/Q47475003",
+                {"wikidata": "Q47475003"},
+            ),
+            (None, "https://www.linkedin.com/in/cthoyt/", {"linkedin": "cthoyt"}),
+            (None, "https://de.linkedin.com/in/j%C3%BCrgen", {"linkedin": "jürgen"}),
+            (
+                None,
+                "https://scholar.google.com/citations?user=PjrpzUIAAAAJ&hl=en",
+                {"google.scholar": "PjrpzUIAAAAJ"},
+            ),
+            (None, "https://scholar.google.com/citations?hl=en", {}),
+            # the LinkedIn and Google Scholar rules win over the prefix rules after them
+            (None, "https://publons.com/author/linkedin.com/in/cthoyt", {"linkedin": "cthoyt"}),
+            (None, "https://publons.com/author/1234567/charles", {"publons.researcher": "1234567"}),
+            (
+                None,
+                "https://www.researchgate.net/profile/Charles-Hoyt",
+                {"researchgate.profile": "Charles-Hoyt"},
+            ),
+            (
+                None,
+                "https://www.scopus.com/authid/detail.uri?authorId=1234567",
+                {"scopus": "1234567"},
+            ),
+            (
+                None,
+                "https://www.webofscience.com/wos/author/record/ABC-1234-2020",
+                {"wos.researcher": "ABC-1234-2020"},
+            ),
+            (None, "http://lattes.cnpq.br/1234567890", {"lattes": "1234567890"}),
+            (
+                None,
+                "https://dialnet.unirioja.es/servlet/autor?codigo=123456",
+                {"dialnet.author": "123456"},
+            ),
+            (
+                None,
+                "https://papers.ssrn.com/sol3/cf_dev/AbsByAuth.cfm?per_id=123456",
+                {"ssrn.author": "123456"},
+            ),
+            (None, "https://osf.io/abcde", {"osf": "abcde"}),
+            (None, "https://viaf.org/viaf/12345", {"viaf": "12345"}),
+            (None, "https://ieeexplore.ieee.org/author/12345", {"ieee.author": "12345"}),
+            (None, "https://loop.frontiersin.org/people/12345/overview", {"loop": "12345"}),
+            (None, "https://loop.frontiersin.org/people/12345/bio", {"loop": "12345"}),
+            (None, "https://dblp.org/pid/123/4567.html", {"dblp.author": "123/4567"}),
+            (None, "https://dblp.uni-trier.de/pid/123/4567", {"dblp.author": "123/4567"}),
+            (None, "https://hub.docker.com/u/cthoyt", {"dockerhub.user": "cthoyt"}),
+            ("Mastodon", "https://scholar.social/@cthoyt", {"mastodon": "@cthoyt@scholar.social"}),
+            (
+                "Mastodon",
+                "https://scholar.social/web/@cthoyt",
+                {"mastodon": "@cthoyt@scholar.social"},
+            ),
+            ("Mastodon", "cthoyt", {}),
+            ("Something else", "https://example.com/cthoyt", {}),
+            (None, "https://example.com/cthoyt", {}),
+        ]:
+            with self.subTest(name=name, url=url):
+                self.assertEqual(
+                    (expected, None),
+                    _get_external_identifiers([], [(name, url)], "0000-0000-0000-0000"),
+                )
+
+    def test_homepage(self):
+        """Test the first personal website is used as the homepage."""
+        self.assertEqual(
+            ({"github": "cthoyt"}, "https://cthoyt.com"),
+            _get_external_identifiers(
+                [],
+                [
+                    ("Personal Website", "https://cthoyt.com/"),
+                    ("GitHub", "https://github.com/cthoyt"),
+                    ("Blog", "https://blog.example.com"),
+                ],
+                "0000-0000-0000-0000",
+            ),
+        )
+
+
+class TestPubMed(unittest.TestCase):
+    """Test standardizing PubMed identifiers."""
+
+    def test_standardize(self):
+        """Test standardizing PubMed identifiers."""
+        for value, expected in [
+            ("12345678", "12345678"),
+            (" 12345678. ", "12345678"),
+            ("12345678/", "12345678"),
+            ("PMID: 12345678", "12345678"),
+            ("PMID:12345678", "12345678"),
+            ("PMID12345678", "12345678"),
+            ("PubMed PMID: 12345678", "12345678"),
+            ("[PMID: 12345678]", "12345678]"),
+            ("https://pubmed.ncbi.nlm.nih.gov/12345678/", "12345678"),
+            ("http://www.ncbi.nlm.nih.gov/pubmed/12345678", "12345678"),
+            ("http://europepmc.org/abstract/med/12345678", "12345678"),
+            ("1.2345678E7", "12345678"),
+            ("1.2.3E7", None),
+            ("PMC1234567", None),
+            ("10.1234/abcd", None),
+            ("", None),
+        ]:
+            with self.subTest(value=value):
+                self.assertEqual(expected, _standardize_pubmed(value))
+
+
+class TestNames(unittest.TestCase):
+    """Test picking the name and aliases for a record."""
+
+    def test_blank_family_name(self):
+        """Test the given names are used when the family name is blank."""
+        self.assertEqual(("Jane Doe", {}), _get_name_and_aliases("Jane Doe, PhD", "", None, []))
+
+    def test_blank_given_names(self):
+        """Test the family name is used when the given names are blank."""
+        self.assertEqual(("Doe", {}), _get_name_and_aliases("", "Doe", None, []))
+
+    def test_missing_names(self):
+        """Test there's no name when everything is missing or blank."""
+        self.assertEqual((None, {}), _get_name_and_aliases(None, "Doe", None, []))
+        self.assertEqual((None, {}), _get_name_and_aliases("", "", None, []))
+
+
+class StubGrounder:
+    """A stand-in for the ROR grounder that only knows one organization."""
+
+    def ground_best(self, name: str):
+        """Ground an organization name."""
+        if name == "Enveda Biosciences":
+            return SimpleNamespace(term=SimpleNamespace(id="01x2y3z45"))
+        return None
+
+
+def _sub_name(text: str, tag: str, value: str | None) -> str:
+    """Replace a personal details element, or remove it if the value is None."""
+    element = "" if value is None else f"<personal-details:{tag}>{value}</personal-details:{tag}>"
+    return re.sub(rf"<personal-details:{tag}>.*?</personal-details:{tag}>", element, text)
+
+
+class TestProcessFile(unittest.TestCase):
+    """Test processing ORCID XML files."""
+
+    def setUp(self):
+        """Load the example XML file."""
+        self.text = EXAMPLE_PATH.read_text()
+
+    def process(self, text: str) -> dict[str, Any] | None:
+        """Process the text of an XML file."""
+        return _process_file(
+            io.BytesIO(text.encode("utf-8")),
+            StubGrounder(),
+            {EXAMPLE_ORCID: "Q47475003"},
+            {EXAMPLE_ORCID: "Charles_Tapley_Hoyt.jpg"},
+        )
+
+    def test_example(self):
+        """Test processing the example file."""
+        self.assertEqual(
+            {
+                "orcid": EXAMPLE_ORCID,
+                "name": "Charles Tapley Hoyt",
+                "aliases": ["Charles Hoyt", "Charlie Hoyt"],
+                "employments": [
+                    {
+                        "name": "Northeastern University",
+                        "xrefs": {"funderregistry": "100015257"},
+                        "start": {"year": 2023, "month": 8, "day": 1},
+                    },
+                    {
+                        "name": "Harvard Medical School",
+                        "xrefs": {"ringgold": "1811"},
+                        "start": {"year": 2021, "month": 2, "day": 15},
+                        "end": {"year": 2023, "month": 7, "day": 31},
+                        "role": "Postdoctoral Researcher",
+                    },
+                    {
+                        "name": "Enveda Biosciences",
+                        "xrefs": {"ror": "01x2y3z45"},
+                        "start": {"year": 2020, "month": 1},
+                        "end": {"year": 2020, "month": 10},
+                        "role": "Computational Biologist",
+                    },
+                    {
+                        "name": "University of Bonn",
+                        "xrefs": {"grid": "grid.10388.32"},
+                        "start": {"year": 2018, "month": 1, "day": 1},
+                        "end": {"year": 2019, "month": 12, "day": 31},
+                        "role": "Lecturer",
+                    },
+                    {
+                        "name": "Fraunhofer SCAI",
+                        "start": {"year": 2016, "month": 2},
+                        "end": {"year": 2019, "month": 12, "day": 31},
+                        "role": "Researcher",
+                    },
+                ],
+                "educations": [
+                    {
+                        "name": "Rheinische Friedrich Wilhelms Universität Bonn",
+                        "start": {"year": 2018, "month": 1, "day": 1},
+                        "end": {"year": 2019, "month": 12, "day": 3},
+                        "role": "Doctor of Philosophy",
+                    },
+                    {
+                        "name": "Rheinische Friedrich Wilhelms Universität Bonn",
+                        "xrefs": {"ringgold": "9374"},
+                        "start": {"year": 2015, "month": 8},
+                        "end": {"year": 2017, "month": 10, "day": 27},
+                        "role": "Master of Science",
+                    },
+                    {
+                        "name": "Northeastern University",
+                        "xrefs": {"ringgold": "1848"},
+                        "start": {"year": 2011, "month": 8},
+                        "end": {"year": 2015, "month": 4},
+                        "role": "Bachelor of Science",
+                    },
+                ],
+                "memberships": [
+                    {"name": "International Society for Biocuration"},
+                    {"name": "American Chemical Society", "xrefs": {"ringgold": "41485"}},
+                ],
+                "xrefs": {
+                    "github": "cthoyt",
+                    "loop": "827476",
+                    "mastodon": "@cthoyt@scholar.social",
+                    "scopus": "56305849200",
+                    "wikidata": "Q47475003",
+                    "wos.researcher": "B-5720-2018",
+                },
+                "homepage": "https://cthoyt.com",
+                "works": [
+                    {"pubmed": "29873705"},
+                    {"pubmed": "30768158"},
+                    {"pubmed": "30854225"},
+                    {"pubmed": "31092193"},
+                    {"pubmed": "31225582"},
+                    {"pubmed": "31604427"},
+                    {"pubmed": "32637990"},
+                    {"pubmed": "36151740"},
+                    {"pubmed": "36208225"},
+                ],
+                "keywords": [
+                    "Cheminformatics",
+                    "Data Integration",
+                    "Knowledge Assembly",
+                    "Networks Biology",
+                    "Systems Biology",
+                ],
+                "countries": ["DE"],
+                "locale": "en",
+                "commons_image": "Charles_Tapley_Hoyt.jpg",
+            },
+            self.process(self.text),
+        )
+
+    def test_missing_person(self):
+        """Test a record without any personal details is skipped."""
+        text = re.sub(r"<person:person .*?</person:person>", "", self.text, flags=re.DOTALL)
+        self.assertIsNone(self.process(text))
+
+    def test_blank_names(self):
+        """Test the given names are used when the family name is blank."""
+        text = _sub_name(self.text, "given-names", "Jane Doe, PhD")
+        text = _sub_name(text, "family-name", "  ")
+        text = _sub_name(text, "credit-name", None)
+        record = self.process(text)
+        self.assertIsNotNone(record)
+        self.assertEqual("Jane Doe", record["name"])
+
+    def test_pubmed_url(self):
+        """Test PubMed identifiers written as URLs are standardized."""
+        text = self.text.replace(
+            "<common:external-id-value>29873705</common:external-id-value>",
+            "<common:external-id-value>https://pubmed.ncbi.nlm.nih.gov/29873705/</common:external-id-value>",
+        )
+        record = self.process(text)
+        self.assertIsNotNone(record)
+        self.assertIn({"pubmed": "29873705"}, record["works"])
+
+    def test_partial_date(self):
+        """Test dates with only a year."""
+        text = re.sub(
+            r"(<common:year>2011</common:year>)\s*<common:month>08</common:month>", r"\1", self.text
+        )
+        record = self.process(text)
+        self.assertIsNotNone(record)
+        self.assertEqual({"year": 2011}, record["educations"][2]["start"])
+
+    def test_invalid_date(self):
+        """Test date parts that are empty or not numbers are skipped."""
+        text = self.text.replace("<common:year>2011</common:year>", "<common:year></common:year>")
+        text = text.replace("<common:month>04</common:month>", "<common:month>April</common:month>")
+        record = self.process(text)
+        self.assertIsNotNone(record)
+        education = record["educations"][2]
+        self.assertNotIn("start", education)
+        self.assertEqual({"year": 2015}, education["end"])
+
+    def test_round_trip(self):
+        """Test a written line can be read back as a record."""
+        record = self.process(self.text)
+        self.assertIsNotNone(record)
+        line = orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+        self.assertEqual(
+            record,
+            Record.model_validate_json(line).model_dump(mode="json", exclude_defaults=True),
+        )
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "needs fork")
+class TestExecutor(unittest.TestCase):
+    """Test the process pool for processing batches of ORCID XML files."""
+
+    def test_fork(self):
+        """Test the workers are ready, but the main process lets go of their state."""
+        get_ror_grounder = lru_cache(1)(StubGrounder)
+        ror = SimpleNamespace(get_ror_grounder=get_ror_grounder)
+        with mock.patch.dict(sys.modules, {"orcid_downloader.ror": ror}):
+            executor, _ = _get_executor({EXAMPLE_ORCID: "Q47475003"}, {})
+        self.assertIsNone(api._worker_process_file)
+        self.assertEqual(0, get_ror_grounder.cache_info().currsize)
+        with executor:
+            result = executor.submit(_process_batch, [EXAMPLE_PATH.read_bytes()]).result()
+        record = orjson.loads(gzip.decompress(result.records_gz))
+        self.assertEqual(EXAMPLE_ORCID, record["orcid"])
+        self.assertEqual("Q47475003", record["xrefs"]["wikidata"])
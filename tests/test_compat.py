@@ -0,0 +1,34 @@
+"""Tests for the optional accelerated implementations."""
+
+import gzip
+import importlib
+import sys
+import unittest
+from unittest import mock
+
+from orcid_downloader import _compat
+
+
+class TestGzip(unittest.TestCase):
+    """Test the gzip implementation."""
+
+    def tearDown(self):
+        """Restore the module, in case a test reloaded it."""
+        importlib.reload(_compat)
+
+    def assert_round_trip(self, gzip_impl) -> None:
+        """Test data compressed by the implementation can be read by the standard library."""
+        data = b'{"orcid": "0000-0000-0000-0000"}\n'
+        self.assertEqual(data, gzip.decompress(gzip_impl.compress(data, compresslevel=1)))
+
+    def test_default(self):
+        """Test the gzip implementation."""
+        self.assert_round_trip(_compat.gzip_impl)
+
+    def test_fallback(self):
+        """Test falling back to the standard library when isal isn't installed."""
+        # a None entry makes importing the module raise an ImportError
+        with mock.patch.dict(sys.modules, {"isal": None, "isal.igzip": None}):
+            module = importlib.reload(_compat)
+        self.assertIs(gzip, module.gzip_impl)
+        self.assert_round_trip(module.gzip_impl)
@@ -0,0 +1,136 @@
+"""Tests for lexical indexing."""
+
+import gzip
+import importlib.util
+import os
+import sqlite3
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest import mock
+
+HAS_LEXICAL = all(importlib.util.find_spec(name) for name in ("gilda", "pandas"))
+
+
+@unittest.skipUnless(HAS_LEXICAL, "gilda and pandas are needed for lexical indexing")
+class TestSqliteEntries(unittest.TestCase):
+    """Test the SQLite lexical index."""
+
+    def setUp(self):
+        """Write a small lexical index."""
+        import orjson
+        from gilda import Term
+
+        from orcid_downloader.lexical import UngroupedSqliteEntries
+
+        self.directory = tempfile.TemporaryDirectory()
+        path = Path(self.directory.name).joinpath("lexical.db")
+        self.term = Term(
+            "jane doe", "Jane Doe", "orcid", "0000-0000-0000-0001", "Jane Doe", "name", "orcid"
+        )
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE terms (norm_text text not null, term text not null)")
+            conn.execute(
+                "INSERT INTO terms VALUES (?, ?)",
+                (self.term.norm_text, orjson.dumps(self.term.to_json()).decode()),
+            )
+        conn.close()
+        self.entries = UngroupedSqliteEntries(path)
+
+    def tearDown(self):
+        """Close the lexical index and remove it."""
+        self.entries.close()
+        self.directory.cleanup()
+
+    def test_get(self):
+        """Test looking up terms."""
+        self.assertEqual([self.term.to_json()], [t.to_json() for t in self.entries.get("jane doe")])
+        self.assertIsNone(self.entries.get("john doe"))
+        self.assertEqual(1, len(self.entries))
+
+    def test_get_from_threads(self):
+        """Test looking up terms from a thread other than the first one to do so."""
+        self.entries.get("jane doe")
+        with ThreadPoolExecutor(2) as executor:
+            results = list(executor.map(self.entries.get, ["jane doe"] * 4))
+        for terms in results:
+            self.assertEqual([self.term.to_json()], [t.to_json() for t in terms])
+
+
+@unittest.skipUnless(HAS_LEXICAL, "gilda and pandas are needed for lexical indexing")
+class TestWriteLexical(unittest.TestCase):
+    """Test building the lexical index from the records."""
+
+    def setUp(self):
+        """Point all the paths to a temporary directory."""
+        from orcid_downloader import api, lexical
+
+        self.directory = tempfile.TemporaryDirectory()
+        directory = Path(self.directory.name)
+        self.records_path = directory.joinpath("records.jsonl.gz")
+        self.patches = [
+            mock.patch.object(api, "RECORDS_PATH", self.records_path),
+            mock.patch.object(lexical, "RECORDS_PATH", self.records_path),
+            mock.patch.object(lexical, "GILDA_PATH", directory.joinpath("gilda.tsv.gz")),
+            mock.patch.object(lexical, "GILDA_HQ_PATH", directory.joinpath("gilda_hq.tsv.gz")),
+            mock.patch.object(lexical, "GILDA_DB_PATH", directory.joinpath("gilda.db")),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        for patch in self.patches:
+            patch.stop()
+        self.directory.cleanup()
+
+    def write_records(self, *names: str) -> None:
+        """Write a records file with a record for each name."""
+        import orjson
+
+        with gzip.open(self.records_path, "wb") as file:
+            for i, name in enumerate(names):
+                record = {"orcid": f"0000-0000-0000-000{i}", "name": name}
+                file.write(orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE))
+
+    def lookup(self, text: str) -> set[tuple[str, str, str]]:
+        """Look up a name in the lexical index."""
+        from gilda.process import normalize
+
+        from orcid_downloader import lexical
+
+        entries = lexical.UngroupedSqliteEntries(lexical.GILDA_DB_PATH)
+        try:
+            terms = entries.get(normalize(text)) or []
+            return {(term.id, term.text, term.status) for term in terms}
+        finally:
+            entries.close()
+
+    def test_round_trip(self):
+        """Test terms written to the Gilda TSV can be looked up in the SQLite index."""
+        from orcid_downloader.lexical import write_gilda, write_lexical
+
+        self.write_records("Jane Doe", 'Jo "Quote" Smith')
+        write_gilda()
+        write_lexical()
+        self.assertEqual({("0000-0000-0000-0000", "Jane Doe", "name")}, self.lookup("Jane Doe"))
+        self.assertEqual({("0000-0000-0000-0000", "J. Doe", "synonym")}, self.lookup("J. Doe"))
+        self.assertEqual(
+            {("0000-0000-0000-0001", 'Jo "Quote" Smith', "name")}, self.lookup('Jo "Quote" Smith')
+        )
+
+    def test_outdated(self):
+        """Test the Gilda TSV is rebuilt when it's older than the records."""
+        from orcid_downloader import lexical
+
+        self.write_records("Jane Doe")
+        lexical.write_gilda()
+        # make the records newer than the Gilda TSV
+        self.write_records("John Roe")
+        mtime = lexical.GILDA_PATH.stat().st_mtime
+        os.utime(self.records_path, (mtime + 10, mtime + 10))
+
+        lexical.write_lexical()
+        self.assertEqual(set(), self.lookup("Jane Doe"))
+        self.assertEqual({("0000-0000-0000-0000", "John Roe", "name")}, self.lookup("John Roe"))
@@ -0,0 +1,35 @@
+"""Tests for name utilities."""
+
+import unittest
+
+from orcid_downloader.name_utils import clean_name, name_to_synonyms
+
+
+class TestNameUtils(unittest.TestCase):
+    """Test name utilities."""
+
+    def test_clean_name(self):
+        """Test stripping titles and degrees from names."""
+        for name, expected in [
+            ("Charles Tapley Hoyt", "Charles Tapley Hoyt"),
+            ("Dr. Jane Doe", "Jane Doe"),
+            ("DR JANE DOE", "Jane Doe"),
+            ("Prof. Dr. Hans Müller", "Hans Müller"),
+            ("Professor Ada Lovelace", "Ada Lovelace"),
+            ("Francess Dufie Azumah (DR.)", "Francess Dufie Azumah"),
+            ("Jane Doe, MD, PhD", "Jane Doe"),
+            ("Jane Doe, Ph.D.", "Jane Doe"),
+            ("Drew Barrymore", "Drew Barrymore"),
+            ("Rahman, Md", "Md Rahman"),
+            ("Jane, Ms", "Ms Jane"),
+            ("Doe Rahman, Md", "Doe Rahman"),
+        ]:
+            with self.subTest(name=name):
+                self.assertEqual(expected, clean_name(name))
+
+    def test_name_to_synonyms(self):
+        """Test synonyms are generated only once each."""
+        synonyms = list(name_to_synonyms("Jane Doe"))
+        self.assertEqual(len(synonyms), len(set(synonyms)))
+        self.assertIn("Doe, J.", synonyms)
+        self.assertIn("J. Doe", synonyms)